@@ -0,0 +1,70 @@
+# about_dialog.py
+"""
+Dialog delle informazioni sull'applicazione PDF Tools.
+Importato da UIManager solo alla prima apertura del dialog.
+"""
+
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QScrollArea
+)
+from PyQt6.QtCore import Qt
+
+
+class AboutDialog(QDialog):
+    """Dialog moderno per le informazioni sull'applicazione con supporto temi."""
+    
+    def __init__(self, translations=None, parent=None):
+        super().__init__(parent)
+        self.translations = translations
+        self.setup_ui()
+    
+    def setup_ui(self):
+        """Configura l'interfaccia del dialog."""
+        self.setWindowTitle(self._get_text('about_title'))
+        self.setFixedSize(550, 450)
+        self.setModal(True)
+        
+        layout = QVBoxLayout(self)
+        layout.setSpacing(25)
+        layout.setContentsMargins(40, 40, 40, 40)
+        
+        # Titolo principale
+        title_label = QLabel("PDF Tools", self)
+        title_label.setProperty("header", "true")
+        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        
+        # Testo delle informazioni (etichetta rich text scorrevole)
+        text_label = QLabel(self)
+        text_label.setTextFormat(Qt.TextFormat.RichText)
+        text_label.setText(self._get_text('about_text'))
+        text_label.setWordWrap(True)
+        text_label.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+        text_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextBrowserInteraction)
+        text_label.setOpenExternalLinks(True)
+        
+        text_area = QScrollArea(self)
+        text_area.setProperty("about", "true")
+        text_area.setWidgetResizable(True)
+        text_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        text_area.setWidget(text_label)
+        text_area.setMaximumHeight(280)
+        
+        # Bottone chiudi
+        close_button = QPushButton(self._get_text('close') if self.translations else 'Close', self)
+        close_button.clicked.connect(self.accept)
+        close_button.setMinimumWidth(120)
+        close_button.setProperty("primary", "true")
+        
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        button_layout.addWidget(close_button)
+        
+        layout.addWidget(title_label)
+        layout.addWidget(text_area)
+        layout.addLayout(button_layout)
+    
+    def _get_text(self, key):
+        """Helper per ottenere testo tradotto."""
+        if self.translations:
+            return self.translations.get(key)
+        return key
@@ -275,7 +275,7 @@ class PDFToolsApplication(QMainWindow):
             self.ui_manager.set_output_file_path(f"Auto-generated in: {output_dir}")
             
             self.ui_manager.show_status_message(
-                self.translations.get('file_selected', file_path), 5000
+                self.translations.fmt('file_selected', file_path), 5000
             )
     
     def compress_pdf(self):
@@ -454,12 +454,12 @@ class PDFToolsApplication(QMainWindow):
         if new_dir and new_dir != current_dir:
             self.output_manager.set_base_output_directory(new_dir)
             self.ui_manager.show_status_message(
-                self.translations.get('output_directory_changed', new_dir), 5000
+                self.translations.fmt('output_directory_changed', new_dir), 5000
             )
             QMessageBox.information(
                 self,
                 self.translations.get('success'),
-                self.translations.get('output_directory_changed', new_dir)
+                self.translations.fmt('output_directory_changed', new_dir)
             )
     
     def open_output_folder(self):
@@ -484,8 +484,8 @@ class PDFToolsApplication(QMainWindow):
             # Costruisce il messaggio delle statistiche
             stats_message = f"""
             <h3>{self.translations.get('statistics_title')}</h3>
-            <p><b>{self.translations.get('total_files', stats['total_files'])}</b></p>
-            <p><b>{self.translations.get('total_size', stats['total_size_mb'])}</b></p>
+            <p><b>{self.translations.fmt('total_files', stats['total_files'])}</b></p>
+            <p><b>{self.translations.fmt('total_size', stats['total_size_mb'])}</b></p>
             
             <h4>{self.translations.get('files_by_type')}</h4>
             <ul>
@@ -524,7 +524,7 @@ class PDFToolsApplication(QMainWindow):
             try:
                 result = self.output_manager.manual_cleanup(days_older_than=30)
                 
-                message = self.translations.get(
+                message = self.translations.fmt(
                     'cleanup_completed',
                     result['deleted_files'],
                     result['deleted_size_mb']
@@ -6,6 +6,10 @@ Integrato con OutputManager per gestione professionale dei file di output.
 """
 
 import os
+import queue
+import shutil
+import threading
+from contextlib import contextmanager
 from io import BytesIO
 from PyPDF2 import PdfReader, PdfWriter
 import pikepdf
@@ -14,6 +18,18 @@ from reportlab.lib.pagesizes import letter
 from output_manager import OutputManager, OutputType
 
 
+class _SourceBuffer(BytesIO):
+    """Buffer con il contenuto di un PDF, descritto dal percorso del file di origine."""
+    
+    def __init__(self, data, path):
+        super().__init__(data)
+        self.name = path
+    
+    def __str__(self):
+        # pikepdf usa str() dello stream nei messaggi di errore
+        return self.name
+
+
 class PDFProcessor:
     """Classe che gestisce tutte le operazioni sui file PDF con gestione output professionale."""
     
@@ -86,14 +102,19 @@ class PDFProcessor:
                 custom_suffix=os.path.splitext(os.path.basename(output_file))[0]
             )
         
-        try:
-            with pikepdf.open(input_file) as pdf:
-                pdf.save(output_file, compress_streams=True)
+        with self._operation_errors("Compression"):
+            buffer = BytesIO()
+            self._compress_stream(input_file, buffer)
             
-            return output_file
+            # Scrive il risultato solo se la compressione ha ridotto le dimensioni,
+            # altrimenti riusa il file originale
+            if buffer.tell() < os.path.getsize(input_file):
+                with open(output_file, 'wb') as out_file:
+                    out_file.write(buffer.getbuffer())
+            else:
+                self._link_or_copy(input_file, output_file)
             
-        except Exception as e:
-            raise Exception(f"Compression failed: {str(e)}")
+            return output_file
     
     def merge_pdfs(self, input_files, output_file=None):
         """
@@ -137,7 +158,7 @@ class PDFProcessor:
                 custom_suffix=os.path.splitext(os.path.basename(output_file))[0]
             )
         
-        try:
+        with self._operation_errors("Merge"):
             writer = PdfWriter()
             
             for file_path in input_files:
@@ -149,9 +170,6 @@ class PDFProcessor:
                 writer.write(out_file)
             
             return output_file
-                
-        except Exception as e:
-            raise Exception(f"Merge failed: {str(e)}")
     
     def protect_pdf(self, input_file, password, output_file=None):
         """
@@ -173,8 +191,7 @@ class PDFProcessor:
         if not self.validate_file_exists(input_file):
             raise FileNotFoundError(f"File not found: {input_file}")
         
-        if not password or not password.strip():
-            raise ValueError("Password cannot be empty")
+        self._validate_password(password)
         
         # Genera automaticamente il percorso di output se non fornito
         if output_file is None:
@@ -190,21 +207,9 @@ class PDFProcessor:
                 custom_suffix=os.path.splitext(os.path.basename(output_file))[0]
             )
         
-        try:
-            with pikepdf.open(input_file) as pdf:
-                pdf.save(
-                    output_file, 
-                    encryption=pikepdf.Encryption(
-                        owner=password, 
-                        user=password, 
-                        R=4
-                    )
-                )
-            
+        with self._operation_errors("Protection"):
+            self._protect_stream(input_file, output_file, password)
             return output_file
-            
-        except Exception as e:
-            raise Exception(f"Protection failed: {str(e)}")
     
     def remove_protection(self, input_file, password, output_file=None):
         """
@@ -226,8 +231,7 @@ class PDFProcessor:
         if not self.validate_file_exists(input_file):
             raise FileNotFoundError(f"File not found: {input_file}")
         
-        if not password or not password.strip():
-            raise ValueError("Password cannot be empty")
+        self._validate_password(password)
         
         # Genera automaticamente il percorso di output se non fornito
         if output_file is None:
@@ -243,14 +247,9 @@ class PDFProcessor:
                 custom_suffix=os.path.splitext(os.path.basename(output_file))[0]
             )
         
-        try:
-            with pikepdf.open(input_file, password=password) as pdf:
-                pdf.save(output_file)
-            
+        with self._operation_errors("Protection removal"):
+            self._unprotect_stream(input_file, output_file, password)
             return output_file
-            
-        except Exception as e:
-            raise Exception(f"Protection removal failed: {str(e)}")
     
     def add_watermark(self, input_file, watermark_text, output_file=None,
                      font_size=40, opacity=0.3, rotation=45):
@@ -276,8 +275,7 @@ class PDFProcessor:
         if not self.validate_file_exists(input_file):
             raise FileNotFoundError(f"File not found: {input_file}")
         
-        if not watermark_text or not watermark_text.strip():
-            raise ValueError("Watermark text cannot be empty")
+        self._validate_watermark_text(watermark_text)
         
         # Genera automaticamente il percorso di output se non fornito
         if output_file is None:
@@ -296,29 +294,146 @@ class PDFProcessor:
                 custom_suffix=os.path.splitext(os.path.basename(output_file))[0]
             )
         
-        try:
-            reader = PdfReader(input_file)
-            writer = PdfWriter()
-            
-            # Crea la filigrana come PDF
-            watermark_pdf = self._create_watermark_pdf(
-                watermark_text, font_size, opacity, rotation
-            )
-            watermark_page = watermark_pdf.pages[0]
-            
-            # Applica la filigrana a tutte le pagine
-            for page_num in range(len(reader.pages)):
-                page = reader.pages[page_num]
-                page.merge_page(watermark_page)
-                writer.add_page(page)
-            
+        with self._operation_errors("Watermark addition"):
             with open(output_file, 'wb') as out_file:
-                writer.write(out_file)
+                self._watermark_stream(
+                    input_file, out_file, watermark_text, font_size, opacity, rotation
+                )
             
             return output_file
-                
+    
+    @staticmethod
+    def _validate_password(password):
+        """
+        Verifica che la password non sia vuota.
+        
+        Raises:
+            ValueError: Se la password è vuota o composta solo da spazi
+        """
+        if not password or not password.strip():
+            raise ValueError("Password cannot be empty")
+    
+    @staticmethod
+    def _validate_watermark_text(watermark_text):
+        """
+        Verifica che il testo della filigrana non sia vuoto.
+        
+        Raises:
+            ValueError: Se il testo è vuoto o composto solo da spazi
+        """
+        if not watermark_text or not watermark_text.strip():
+            raise ValueError("Watermark text cannot be empty")
+    
+    @staticmethod
+    @contextmanager
+    def _operation_errors(action, input_file=None):
+        """
+        Riporta gli errori di un'operazione con un messaggio uniforme.
+        
+        Args:
+            action (str): Nome dell'operazione (es. "Compression")
+            input_file (str): Percorso del file elaborato, aggiunto al messaggio
+                se l'errore originale non lo contiene già
+            
+        Raises:
+            Exception: "<action> failed: <errore originale>"
+        """
+        try:
+            yield
         except Exception as e:
-            raise Exception(f"Watermark addition failed: {str(e)}")
+            message = str(e)
+            if input_file and input_file not in message:
+                message = f"{input_file}: {message}"
+            raise Exception(f"{action} failed: {message}")
+    
+    @staticmethod
+    def _link_or_copy(source, destination):
+        """
+        Crea un hard link al file sorgente, con copia come fallback.
+        
+        Args:
+            source (str): Percorso del file sorgente
+            destination (str): Percorso del file di destinazione
+        """
+        try:
+            os.link(source, destination)
+        except (OSError, AttributeError):
+            # File system diversi o link non supportati (es. alcune unità Windows)
+            shutil.copyfile(source, destination)
+    
+    @staticmethod
+    def _compress_stream(source, destination):
+        """
+        Comprime un PDF da una sorgente a una destinazione.
+        
+        Args:
+            source: Percorso o stream del PDF di input
+            destination: Percorso o stream di output
+        """
+        with pikepdf.open(source) as pdf:
+            pdf.save(destination, compress_streams=True)
+    
+    @staticmethod
+    def _protect_stream(source, destination, password):
+        """
+        Cifra un PDF da una sorgente a una destinazione.
+        
+        Args:
+            source: Percorso o stream del PDF di input
+            destination: Percorso o stream di output
+            password (str): Password per proteggere il PDF
+        """
+        with pikepdf.open(source) as pdf:
+            pdf.save(
+                destination, 
+                encryption=pikepdf.Encryption(
+                    owner=password, 
+                    user=password, 
+                    R=4
+                )
+            )
+    
+    @staticmethod
+    def _unprotect_stream(source, destination, password):
+        """
+        Decifra un PDF da una sorgente a una destinazione.
+        
+        Args:
+            source: Percorso o stream del PDF protetto
+            destination: Percorso o stream di output
+            password (str): Password per rimuovere la protezione
+        """
+        with pikepdf.open(source, password=password) as pdf:
+            pdf.save(destination)
+    
+    def _watermark_stream(self, source, destination, watermark_text,
+                          font_size=40, opacity=0.3, rotation=45):
+        """
+        Applica una filigrana a tutte le pagine di un PDF.
+        
+        Args:
+            source: Percorso o stream del PDF di input
+            destination: Stream di output scrivibile
+            watermark_text (str): Testo della filigrana
+            font_size (int): Dimensione del font
+            opacity (float): Opacità
+            rotation (int): Rotazione in gradi
+        """
+        reader = PdfReader(source)
+        writer = PdfWriter()
+        
+        # Crea la filigrana come PDF
+        watermark_pdf = self._create_watermark_pdf(
+            watermark_text, font_size, opacity, rotation
+        )
+        watermark_page = watermark_pdf.pages[0]
+        
+        # Applica la filigrana a tutte le pagine
+        for page in reader.pages:
+            page.merge_page(watermark_page)
+            writer.add_page(page)
+        
+        writer.write(destination)
     
     @staticmethod
     def _create_watermark_pdf(text, font_size, opacity, rotation):
@@ -352,13 +467,20 @@ class PDFProcessor:
         packet.seek(0)
         return PdfReader(packet)
     
-    def batch_process_directory(self, input_directory, operation, **kwargs):
+    def batch_process_directory(self, input_directory, operation,
+                                concurrency_limit=None, **kwargs):
         """
         Elabora tutti i PDF in una directory con l'operazione specificata.
         
+        L'elaborazione avviene in pipeline: un thread legge i file successivi
+        mentre i worker elaborano quelli correnti e il thread chiamante scrive
+        i risultati già pronti, così disco e CPU lavorano in parallelo.
+        
         Args:
             input_directory (str): Directory contenente i PDF da elaborare
             operation (str): Tipo di operazione ('compress', 'watermark', 'protect')
+            concurrency_limit (int): Numero di worker e dimensione massima delle
+                code tra gli stadi (opzionale, default: min(4, CPU))
             **kwargs: Parametri specifici per l'operazione
             
         Returns:
@@ -396,46 +518,166 @@ class PDFProcessor:
             'failed_list': []
         }
         
-        for input_file in pdf_files:
+        if concurrency_limit is None:
+            concurrency_limit = min(4, os.cpu_count() or 1)
+        concurrency_limit = max(1, int(concurrency_limit))
+        worker_count = min(concurrency_limit, len(pdf_files))
+        
+        # Code limitate: al massimo concurrency_limit documenti in memoria per stadio
+        read_queue = queue.Queue(maxsize=concurrency_limit)
+        write_queue = queue.Queue(maxsize=concurrency_limit)
+        
+        def reader():
+            """Stadio 1: legge i file di input in memoria."""
             try:
-                filename = os.path.basename(input_file)
-                output_file = os.path.join(batch_dir, filename)
+                for index, input_file in enumerate(pdf_files):
+                    try:
+                        with open(input_file, 'rb') as f:
+                            data = f.read()
+                        read_queue.put((index, input_file, data, None))
+                    except Exception as e:
+                        read_queue.put((index, input_file, None, e))
+            finally:
+                # Sblocca sempre i worker, anche se la lettura si interrompe
+                for _ in range(worker_count):
+                    read_queue.put(None)
+        
+        def worker():
+            """Stadio 2: elabora i documenti in memoria."""
+            try:
+                while True:
+                    item = read_queue.get()
+                    if item is None:
+                        return
+                    
+                    index, input_file, data, error = item
+                    output = None
+                    if error is None:
+                        try:
+                            output = self._process_batch_item(
+                                operation, data, input_file, **kwargs
+                            )
+                        except Exception as e:
+                            error = e
+                    write_queue.put((index, input_file, output, error))
+            finally:
+                # Il thread chiamante attende un segnale di fine per ogni worker,
+                # anche se il worker termina per un errore imprevisto
+                write_queue.put(None)
+        
+        threads = [threading.Thread(target=reader, daemon=True)]
+        threads.extend(
+            threading.Thread(target=worker, daemon=True) for _ in range(worker_count)
+        )
+        for thread in threads:
+            thread.start()
+        
+        # Stadio 3: il thread chiamante scrive i risultati su disco
+        processed = []
+        failed = []
+        finished_workers = 0
+        while finished_workers < worker_count:
+            item = write_queue.get()
+            if item is None:
+                finished_workers += 1
+                continue
+            
+            index, input_file, output, error = item
+            try:
+                if error is not None:
+                    raise error
                 
-                if operation == 'compress':
-                    processed_file = self.compress_pdf(input_file, output_file)
-                elif operation == 'watermark':
-                    watermark_text = kwargs.get('watermark_text', 'PROCESSED')
-                    processed_file = self.add_watermark(input_file, watermark_text, output_file)
-                elif operation == 'protect':
-                    password = kwargs.get('password')
-                    if not password:
-                        raise ValueError("Password required for protection")
-                    processed_file = self.protect_pdf(input_file, password, output_file)
-                elif operation == 'remove_protection':
-                    password = kwargs.get('password')
-                    if not password:
-                        raise ValueError("Password required for removing protection")
-                    processed_file = self.remove_protection(input_file, password, output_file)
-                else:
-                    raise ValueError(f"Unknown operation: {operation}")
+                filename = os.path.basename(input_file)
+                processed_file = self.output_manager.get_output_path(
+                    input_file,
+                    output_type,
+                    custom_suffix=os.path.splitext(filename)[0]
+                )
+                with open(processed_file, 'wb') as out_file:
+                    out_file.write(output.getbuffer())
                 
-                results['processed_files'] += 1
-                results['processed_list'].append({
+                processed.append((index, {
                     'input_file': input_file,
                     'output_file': processed_file,
                     'status': 'success'
-                })
+                }))
                 
             except Exception as e:
-                results['failed_files'] += 1
-                results['failed_list'].append({
+                failed.append((index, {
                     'input_file': input_file,
                     'error': str(e),
                     'status': 'failed'
-                })
+                }))
+        
+        # Se i worker si sono interrotti in anticipo, il lettore può essere fermo
+        # su una coda piena: la svuota finché non termina
+        while threads[0].is_alive():
+            try:
+                read_queue.get(timeout=0.05)
+            except queue.Empty:
+                pass
+        
+        for thread in threads:
+            thread.join()
+        
+        # Mantiene l'ordine originale dei file nei risultati
+        results['processed_list'] = [entry for _, entry in sorted(processed, key=lambda p: p[0])]
+        results['failed_list'] = [entry for _, entry in sorted(failed, key=lambda p: p[0])]
+        results['processed_files'] = len(processed)
+        results['failed_files'] = len(failed)
         
         return results
     
+    def _process_batch_item(self, operation, data, input_file, **kwargs):
+        """
+        Applica un'operazione batch a un PDF già letto in memoria.
+        
+        Args:
+            operation (str): Tipo di operazione
+            data (bytes): Contenuto del PDF di input
+            input_file (str): Percorso del file di origine, usato nei messaggi di errore
+            **kwargs: Parametri specifici per l'operazione
+            
+        Returns:
+            BytesIO: Buffer contenente il PDF elaborato
+            
+        Raises:
+            ValueError: Se mancano parametri o l'operazione è sconosciuta
+            Exception: Per altri errori durante l'elaborazione
+        """
+        source = _SourceBuffer(data, input_file)
+        output = BytesIO()
+        
+        if operation == 'compress':
+            with self._operation_errors("Compression", input_file):
+                self._compress_stream(source, output)
+            # Mantiene l'originale se la compressione non riduce le dimensioni
+            if output.tell() >= len(data):
+                output = BytesIO(data)
+        elif operation == 'watermark':
+            watermark_text = kwargs.get('watermark_text', 'PROCESSED')
+            self._validate_watermark_text(watermark_text)
+            with self._operation_errors("Watermark addition", input_file):
+                self._watermark_stream(source, output, watermark_text)
+        elif operation == 'protect':
+            password = kwargs.get('password')
+            if not password:
+                raise ValueError("Password required for protection")
+            self._validate_password(password)
+            with self._operation_errors("Protection", input_file):
+                self._protect_stream(source, output, password)
+        elif operation == 'remove_protection':
+            password = kwargs.get('password')
+            if not password:
+                raise ValueError("Password required for removing protection")
+            self._validate_password(password)
+            with self._operation_errors("Protection removal", input_file):
+                self._unprotect_stream(source, output, password)
+        else:
+            raise ValueError(f"Unknown operation: {operation}")
+        
+        return output
+    
     def get_output_manager(self):
         """Restituisce l'OutputManager corrente."""
         return self.output_manager
@@ -496,12 +738,16 @@ class PDFValidator:
     """Classe per la validazione di file PDF e parametri."""
     
     @staticmethod
-    def is_valid_pdf(file_path):
+    def is_valid_pdf(file_path, strict=False):
         """
         Verifica se un file è un PDF valido.
         
+        Di default controlla solo la firma iniziale '%PDF-' e il marcatore
+        '%%EOF' nell'ultimo KB, senza analizzare il documento.
+        
         Args:
             file_path (str): Percorso del file
+            strict (bool): Se True, esegue anche il parsing completo del PDF
             
         Returns:
             bool: True se è un PDF valido, False altrimenti
@@ -510,6 +756,18 @@ class PDFValidator:
             if not PDFProcessor.validate_file_exists(file_path):
                 return False
             
+            with open(file_path, 'rb') as file:
+                head = file.read(5)
+                file.seek(0, os.SEEK_END)
+                file.seek(max(0, file.tell() - 1024))
+                tail = file.read()
+            
+            if head != b'%PDF-' or b'%%EOF' not in tail:
+                return False
+            
+            if not strict:
+                return True
+            
             with open(file_path, 'rb') as file:
                 reader = PdfReader(file)
                 # Prova a leggere la prima pagina
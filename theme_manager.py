@@ -5,12 +5,19 @@ Supporta tre varianti di colore professionali e può essere utilizzato
 in qualsiasi applicazione PyQt6.
 """
 
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QPalette, QColor
 from enum import Enum
-import json
+from functools import cached_property, lru_cache
+from string import Template
 import os
+import sys
+
+try:
+    import orjson as _json
+except ImportError:  # orjson è opzionale
+    import json as _json
 
 
 class ThemeVariant(Enum):
@@ -20,113 +27,594 @@ class ThemeVariant(Enum):
     BLUE = "blue"
 
 
+# Mappa valore salvato -> variante, per il caricamento delle impostazioni
+_VALUE_TO_VARIANT = {variant.value: variant for variant in ThemeVariant}
+
+
+# Contenuto del file di impostazioni per ogni variante, già codificato in JSON
+_ENCODED_SETTINGS = {
+    variant: b'{"current_theme": "%s"}' % variant.value.encode()
+    for variant in ThemeVariant
+}
+_ENCODED_TO_VARIANT = {data: variant for variant, data in _ENCODED_SETTINGS.items()}
+
+
+@lru_cache(maxsize=8)
+def _read_settings(path, mtime):
+    """
+    Legge il tema dal file di impostazioni, una sola volta per versione del file.
+    
+    Il contenuto viene confrontato con le codifiche note; il parsing JSON
+    completo avviene solo per file modificati manualmente.
+    
+    Args:
+        path (str): Percorso del file
+        mtime (float): Data di modifica, usata solo come chiave di cache
+        
+    Returns:
+        ThemeVariant: Variante salvata, o None se non riconosciuta
+    """
+    with open(path, 'rb') as f:
+        data = f.read().strip()
+    
+    variant = _ENCODED_TO_VARIANT.get(data)
+    if variant is None:
+        settings = _json.loads(data)
+        variant = _VALUE_TO_VARIANT.get(settings.get('current_theme', 'light'))
+    return variant
+
+
 class ColorScheme:
     """Definisce uno schema di colori per un tema."""
     
+    # Colori di default, usati per le chiavi non specificate dallo schema
+    _DEFAULTS = {
+        'primary': '#0078d4',
+        'primary_hover': '#106ebe',
+        'primary_pressed': '#005a9e',
+        'secondary': '#f3f2f1',
+        'secondary_hover': '#edebe9',
+        'secondary_pressed': '#e1dfdd',
+        'background': '#ffffff',
+        'surface': '#fafafa',
+        'surface_alt': '#f5f5f5',
+        'border': '#e1dfdd',
+        'border_hover': '#323130',
+        'text_primary': '#323130',
+        'text_secondary': '#605e5c',
+        'text_disabled': '#a19f9d',
+        'accent': '#107c10',
+        'warning': '#ff8c00',
+        'error': '#d13438',
+        'success': '#107c10'
+    }
+    
+    # Nomi dei colori dello schema
+    COLOR_NAMES = tuple(_DEFAULTS)
+    
+    # Gradienti verticali precalcolati: nome -> (colore iniziale, colore finale)
+    _GRADIENTS = {
+        'gradient_surface': ('surface', 'surface_alt'),
+        'gradient_surface_reverse': ('surface_alt', 'surface'),
+        'gradient_primary': ('primary', 'primary_pressed'),
+        'gradient_primary_hover': ('primary_hover', 'primary'),
+        'gradient_secondary': ('secondary', 'secondary_hover'),
+        'gradient_secondary_hover': ('secondary_hover', 'secondary_pressed')
+    }
+    
+    # '__dict__' resta disponibile solo per i valori memorizzati da cached_property
+    __slots__ = (
+        ('name',) + COLOR_NAMES + tuple(_GRADIENTS) +
+        ('as_dict', 'qcolors', '_styles', '__dict__')
+    )
+    
     def __init__(self, name, colors):
         self.name = name
-        self.primary = colors.get('primary', '#0078d4')
-        self.primary_hover = colors.get('primary_hover', '#106ebe')
-        self.primary_pressed = colors.get('primary_pressed', '#005a9e')
-        self.secondary = colors.get('secondary', '#f3f2f1')
-        self.secondary_hover = colors.get('secondary_hover', '#edebe9')
-        self.secondary_pressed = colors.get('secondary_pressed', '#e1dfdd')
-        self.background = colors.get('background', '#ffffff')
-        self.surface = colors.get('surface', '#fafafa')
-        self.surface_alt = colors.get('surface_alt', '#f5f5f5')
-        self.border = colors.get('border', '#e1dfdd')
-        self.border_hover = colors.get('border_hover', '#323130')
-        self.text_primary = colors.get('text_primary', '#323130')
-        self.text_secondary = colors.get('text_secondary', '#605e5c')
-        self.text_disabled = colors.get('text_disabled', '#a19f9d')
-        self.accent = colors.get('accent', '#107c10')
-        self.warning = colors.get('warning', '#ff8c00')
-        self.error = colors.get('error', '#d13438')
-        self.success = colors.get('success', '#107c10')
-
-
-class ThemeManager(QObject):
+        
+        # Mappa colori usata anche per formattare i template QSS; i valori
+        # sono internati così i colori ripetuti tra temi condividono la stessa stringa
+        self.as_dict = {
+            key: sys.intern(value)
+            for key, value in {**self._DEFAULTS, **colors}.items()
+        }
+        for key in self.COLOR_NAMES:
+            setattr(self, key, self.as_dict[key])
+        
+        # Gradienti QSS costruiti una volta sola e usati come segnaposto nei template
+        for key, (start, stop) in self._GRADIENTS.items():
+            gradient = (
+                "qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, "
+                f"stop: 0 {self.as_dict[start]}, stop: 1 {self.as_dict[stop]})"
+            )
+            self.as_dict[key] = gradient
+            setattr(self, key, gradient)
+        
+        # Colori Qt precalcolati, per evitare il parsing esadecimale a ogni applicazione
+        self.qcolors = {key: QColor(self.as_dict[key]) for key in self.COLOR_NAMES}
+        
+        # Stili QSS già generati, per nome
+        self._styles = {}
+    
+    def style(self, name):
+        """
+        Restituisce uno stile QSS dello schema, generandolo al primo accesso.
+        
+        Args:
+            name (str): Nome dello stile (chiave di _TEMPLATES)
+            
+        Returns:
+            str: Foglio di stile formattato con i colori dello schema
+        """
+        try:
+            return self._styles[name]
+        except KeyError:
+            style = self._styles[name] = _TEMPLATES[name].substitute(self.as_dict)
+            return style
+    
+    @cached_property
+    def palette(self):
+        """Palette Qt dell'applicazione, costruita una sola volta per schema."""
+        colors = self.qcolors
+        palette = QPalette()
+        palette.setColor(QPalette.ColorRole.Window, colors['background'])
+        palette.setColor(QPalette.ColorRole.WindowText, colors['text_primary'])
+        palette.setColor(QPalette.ColorRole.Base, colors['surface'])
+        palette.setColor(QPalette.ColorRole.AlternateBase, colors['surface_alt'])
+        palette.setColor(QPalette.ColorRole.ToolTipBase, colors['surface'])
+        palette.setColor(QPalette.ColorRole.ToolTipText, colors['text_primary'])
+        palette.setColor(QPalette.ColorRole.Text, colors['text_primary'])
+        palette.setColor(QPalette.ColorRole.Button, colors['secondary'])
+        palette.setColor(QPalette.ColorRole.ButtonText, colors['text_primary'])
+        palette.setColor(QPalette.ColorRole.BrightText, colors['error'])
+        palette.setColor(QPalette.ColorRole.Link, colors['primary'])
+        palette.setColor(QPalette.ColorRole.Highlight, colors['primary'])
+        palette.setColor(QPalette.ColorRole.HighlightedText, QColor('#ffffff'))
+        return palette
+    
+    @cached_property
+    def full_stylesheet(self):
+        """Foglio di stile completo, con tutti i frammenti concatenati."""
+        return "\n".join((
+            self.style('main_window'),
+            self.style('toolbar'),
+            self.style('groupbox'),
+            self.style('lineedit'),
+            self.style('label'),
+            self.style('statusbar'),
+            self.style('dialog'),
+            self.style('button'),
+            self.style('primary_button_scoped'),
+            self.style('menu'),
+        ))
+
+
+# Temi di default professionali, condivisi da tutte le istanze di ThemeManager
+_DEFAULT_THEMES = {
+    ThemeVariant.LIGHT: ColorScheme("Light Professional", {
+        'primary': '#0078d4',
+        'primary_hover': '#106ebe',
+        'primary_pressed': '#005a9e',
+        'secondary': '#f8f9fa',
+        'secondary_hover': '#e9ecef',
+        'secondary_pressed': '#dee2e6',
+        'background': '#ffffff',
+        'surface': '#f8f9fa',
+        'surface_alt': '#e9ecef',
+        'border': '#dee2e6',
+        'border_hover': '#6c757d',
+        'text_primary': '#212529',
+        'text_secondary': '#6c757d',
+        'text_disabled': '#adb5bd',
+        'accent': '#20c997',
+        'warning': '#ffc107',
+        'error': '#dc3545',
+        'success': '#28a745'
+    }),
+    
+    ThemeVariant.DARK: ColorScheme("Dark Professional", {
+        'primary': '#0d7377',
+        'primary_hover': '#14a085',
+        'primary_pressed': '#0a5d61',
+        'secondary': '#2d3748',
+        'secondary_hover': '#4a5568',
+        'secondary_pressed': '#1a202c',
+        'background': '#1a1a1a',
+        'surface': '#2d3748',
+        'surface_alt': '#4a5568',
+        'border': '#4a5568',
+        'border_hover': '#718096',
+        'text_primary': '#f7fafc',
+        'text_secondary': '#e2e8f0',
+        'text_disabled': '#718096',
+        'accent': '#38b2ac',
+        'warning': '#ed8936',
+        'error': '#f56565',
+        'success': '#48bb78'
+    }),
+    
+    ThemeVariant.BLUE: ColorScheme("Corporate Blue", {
+        'primary': '#1e3a8a',
+        'primary_hover': '#1e40af',
+        'primary_pressed': '#1e3a8a',
+        'secondary': '#eff6ff',
+        'secondary_hover': '#dbeafe',
+        'secondary_pressed': '#bfdbfe',
+        'background': '#f8fafc',
+        'surface': '#ffffff',
+        'surface_alt': '#f1f5f9',
+        'border': '#cbd5e1',
+        'border_hover': '#475569',
+        'text_primary': '#0f172a',
+        'text_secondary': '#475569',
+        'text_disabled': '#94a3b8',
+        'accent': '#0ea5e9',
+        'warning': '#f59e0b',
+        'error': '#ef4444',
+        'success': '#10b981'
+    })
+}
+
+
+# Template QSS: i segnaposto $nome corrispondono ai colori di ColorScheme
+
+_MAIN_WINDOW_TEMPLATE = Template("""
+    QMainWindow {
+        background-color: $background;
+        color: $text_primary;
+    }
+    
+    QMainWindow::separator {
+        background-color: $border;
+        width: 1px;
+        height: 1px;
+    }
+""")
+
+_TOOLBAR_TEMPLATE = Template("""
+    QToolBar {
+        background: $gradient_surface;
+        border: none;
+        border-bottom: 2px solid $border;
+        spacing: 8px;
+        padding: 8px 12px;
+        font-weight: 500;
+    }
+    
+    QToolBar::separator {
+        background-color: $border;
+        width: 1px;
+        margin: 4px 8px;
+    }
+    
+    QToolBar QToolButton {
+        background-color: transparent;
+        border: 2px solid transparent;
+        border-radius: 8px;
+        padding: 8px 16px;
+        margin: 2px;
+        font-size: 11pt;
+        font-weight: 500;
+        color: $text_primary;
+        min-width: 80px;
+        min-height: 32px;
+    }
+    
+    QToolBar QToolButton:hover {
+        background-color: $secondary_hover;
+        border-color: $border_hover;
+    }
+    
+    QToolBar QToolButton:pressed {
+        background-color: $secondary_pressed;
+        border-color: $primary;
+    }
+    
+    QToolBar QToolButton:disabled {
+        color: $text_disabled;
+        background-color: transparent;
+        border-color: transparent;
+    }
+    
+    QToolBar QToolButton[primary="true"] {
+        background-color: $primary;
+        color: white;
+        border-color: $primary;
+        font-weight: bold;
+    }
+    
+    QToolBar QToolButton[primary="true"]:hover {
+        background-color: $primary_hover;
+    }
+    
+    QToolBar QToolButton[primary="true"]:pressed {
+        background-color: $primary_pressed;
+    }
+    
+    QToolBar QToolButton[primary="true"]:disabled {
+        background-color: $text_disabled;
+        border-color: $text_disabled;
+    }
+""")
+
+_GROUPBOX_TEMPLATE = Template("""
+    QGroupBox {
+        font-weight: 600;
+        font-size: 12pt;
+        border: 2px solid $border;
+        border-radius: 12px;
+        margin: 15px 0px;
+        padding-top: 20px;
+        background-color: $surface;
+        color: $text_primary;
+    }
+    
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 20px;
+        padding: 0 15px 0 15px;
+        background-color: $surface;
+        color: $primary;
+        font-weight: bold;
+    }
+""")
+
+_LINEEDIT_TEMPLATE = Template("""
+    QLineEdit {
+        border: 2px solid $border;
+        border-radius: 8px;
+        padding: 12px 16px;
+        font-size: 11pt;
+        background-color: $background;
+        color: $text_primary;
+        selection-background-color: $primary;
+        selection-color: white;
+    }
+    
+    QLineEdit:focus {
+        border-color: $primary;
+        background-color: $background;
+    }
+    
+    QLineEdit:disabled {
+        background-color: $surface_alt;
+        color: $text_disabled;
+        border-color: $border;
+    }
+    
+    QLineEdit[readOnly="true"] {
+        background-color: $surface_alt;
+        color: $text_secondary;
+        border: 2px solid $border;
+        font-style: italic;
+        border-radius: 8px;
+        padding: 12px 16px;
+    }
+    
+    QLineEdit::placeholder {
+        color: $text_secondary;
+        font-style: italic;
+    }
+""")
+
+_LABEL_TEMPLATE = Template("""
+    QLabel {
+        color: $text_primary;
+        font-size: 11pt;
+        font-weight: 500;
+    }
+    
+    QLabel[header="true"] {
+        font-size: 14pt;
+        font-weight: bold;
+        color: $primary;
+    }
+    
+    QLabel:disabled {
+        color: $text_disabled;
+    }
+""")
+
+_STATUSBAR_TEMPLATE = Template("""
+    QStatusBar {
+        background: $gradient_surface_reverse;
+        border-top: 1px solid $border;
+        padding: 8px 16px;
+        font-size: 10pt;
+        color: $text_secondary;
+    }
+    
+    QStatusBar::item {
+        border: none;
+    }
+""")
+
+_DIALOG_TEMPLATE = Template("""
+    QDialog {
+        background-color: $background;
+        color: $text_primary;
+    }
+    
+    QScrollArea[about="true"] {
+        border: 2px solid $border;
+        border-radius: 8px;
+        background-color: $surface;
+    }
+    
+    QScrollArea[about="true"] QLabel {
+        background-color: $surface;
+        padding: 16px;
+        font-size: 10pt;
+        font-weight: normal;
+        color: $text_primary;
+    }
+""")
+
+# $selector è il selettore dei bottoni a cui si applica lo stile primario
+_PRIMARY_BUTTON_TEMPLATE = Template("""
+    $selector {
+        background: $gradient_primary;
+        color: white;
+        border: none;
+        border-radius: 8px;
+        font-weight: bold;
+        font-size: 11pt;
+        padding: 12px 20px;
+        min-width: 100px;
+        min-height: 40px;
+    }
+    
+    $selector:hover {
+        background: $gradient_primary_hover;
+    }
+    
+    $selector:pressed {
+        background-color: $primary_pressed;
+    }
+    
+    $selector:disabled {
+        background-color: $text_disabled;
+        color: $surface;
+    }
+""")
+
+_BUTTON_TEMPLATE = Template("""
+    QPushButton {
+        background: $gradient_secondary;
+        color: $text_primary;
+        border: 2px solid $border;
+        border-radius: 8px;
+        font-size: 11pt;
+        font-weight: 500;
+        padding: 12px 20px;
+        min-width: 100px;
+        min-height: 40px;
+    }
+    
+    QPushButton:hover {
+        background: $gradient_secondary_hover;
+        border-color: $border_hover;
+    }
+    
+    QPushButton:pressed {
+        background-color: $secondary_pressed;
+        border-color: $primary;
+    }
+    
+    QPushButton:disabled {
+        background-color: $surface_alt;
+        color: $text_disabled;
+        border-color: $border;
+    }
+""")
+
+_MENU_TEMPLATE = Template("""
+    QMenuBar {
+        background-color: $surface;
+        color: $text_primary;
+        border-bottom: 1px solid $border;
+        padding: 4px 8px;
+        font-size: 11pt;
+    }
+    
+    QMenuBar::item {
+        background-color: transparent;
+        padding: 8px 12px;
+        border-radius: 4px;
+    }
+    
+    QMenuBar::item:selected {
+        background-color: $secondary_hover;
+        color: $text_primary;
+    }
+    
+    QMenuBar::item:pressed {
+        background-color: $secondary_pressed;
+    }
+    
+    QMenu {
+        background-color: $background;
+        border: 2px solid $border;
+        border-radius: 8px;
+        padding: 8px 0px;
+        color: $text_primary;
+    }
+    
+    QMenu::item {
+        padding: 8px 20px;
+        background-color: transparent;
+    }
+    
+    QMenu::item:selected {
+        background-color: $secondary_hover;
+        color: $text_primary;
+    }
+    
+    QMenu::separator {
+        height: 1px;
+        background-color: $border;
+        margin: 4px 12px;
+    }
+""")
+
+
+# Template disponibili per nome, usati da ColorScheme.style()
+_TEMPLATES = {
+    'main_window': _MAIN_WINDOW_TEMPLATE,
+    'toolbar': _TOOLBAR_TEMPLATE,
+    'groupbox': _GROUPBOX_TEMPLATE,
+    'lineedit': _LINEEDIT_TEMPLATE,
+    'label': _LABEL_TEMPLATE,
+    'statusbar': _STATUSBAR_TEMPLATE,
+    'dialog': _DIALOG_TEMPLATE,
+    'button': _BUTTON_TEMPLATE,
+    'primary_button': Template(_PRIMARY_BUTTON_TEMPLATE.safe_substitute(selector='QPushButton')),
+    # Nel foglio unico lo stile primario si applica solo ai bottoni primary="true"
+    'primary_button_scoped': Template(
+        _PRIMARY_BUTTON_TEMPLATE.safe_substitute(selector='QPushButton[primary="true"]')
+    ),
+    'menu': _MENU_TEMPLATE
+}
+
+
+class _SingletonMeta(type(QObject)):
+    """Metaclasse che crea una sola istanza per classe e la riusa."""
+    
+    def __call__(cls, *args, **kwargs):
+        instance = cls.__dict__.get('_instance')
+        if instance is None:
+            instance = super().__call__(*args, **kwargs)
+            cls._instance = instance
+        return instance
+
+
+class ThemeManager(QObject, metaclass=_SingletonMeta):
     """
     Gestisce i temi dell'applicazione e fornisce stili CSS.
     Completamente riutilizzabile in altre applicazioni PyQt6.
+    
+    È un singleton: ogni chiamata a ThemeManager() restituisce la stessa
+    istanza, così impostazioni e cache sono condivise in tutto il processo.
     """
     
     # Segnale emesso quando il tema cambia
     theme_changed = pyqtSignal(str)
     
+    # Ritardo (ms) con cui i cambi di tema ravvicinati vengono salvati su disco
+    SAVE_DELAY_MS = 500
+    
     def __init__(self):
         super().__init__()
         self.current_theme = ThemeVariant.LIGHT
-        self.themes = self._create_default_themes()
+        self.themes = _DEFAULT_THEMES
         self.settings_file = "theme_settings.json"
+        self._save_pending = False
+        self._saved_theme = None
         self._load_saved_theme()
-    
-    def _create_default_themes(self):
-        """Crea i temi di default professionali."""
-        return {
-            ThemeVariant.LIGHT: ColorScheme("Light Professional", {
-                'primary': '#0078d4',
-                'primary_hover': '#106ebe',
-                'primary_pressed': '#005a9e',
-                'secondary': '#f8f9fa',
-                'secondary_hover': '#e9ecef',
-                'secondary_pressed': '#dee2e6',
-                'background': '#ffffff',
-                'surface': '#f8f9fa',
-                'surface_alt': '#e9ecef',
-                'border': '#dee2e6',
-                'border_hover': '#6c757d',
-                'text_primary': '#212529',
-                'text_secondary': '#6c757d',
-                'text_disabled': '#adb5bd',
-                'accent': '#20c997',
-                'warning': '#ffc107',
-                'error': '#dc3545',
-                'success': '#28a745'
-            }),
-            
-            ThemeVariant.DARK: ColorScheme("Dark Professional", {
-                'primary': '#0d7377',
-                'primary_hover': '#14a085',
-                'primary_pressed': '#0a5d61',
-                'secondary': '#2d3748',
-                'secondary_hover': '#4a5568',
-                'secondary_pressed': '#1a202c',
-                'background': '#1a1a1a',
-                'surface': '#2d3748',
-                'surface_alt': '#4a5568',
-                'border': '#4a5568',
-                'border_hover': '#718096',
-                'text_primary': '#f7fafc',
-                'text_secondary': '#e2e8f0',
-                'text_disabled': '#718096',
-                'accent': '#38b2ac',
-                'warning': '#ed8936',
-                'error': '#f56565',
-                'success': '#48bb78'
-            }),
-            
-            ThemeVariant.BLUE: ColorScheme("Corporate Blue", {
-                'primary': '#1e3a8a',
-                'primary_hover': '#1e40af',
-                'primary_pressed': '#1e3a8a',
-                'secondary': '#eff6ff',
-                'secondary_hover': '#dbeafe',
-                'secondary_pressed': '#bfdbfe',
-                'background': '#f8fafc',
-                'surface': '#ffffff',
-                'surface_alt': '#f1f5f9',
-                'border': '#cbd5e1',
-                'border_hover': '#475569',
-                'text_primary': '#0f172a',
-                'text_secondary': '#475569',
-                'text_disabled': '#94a3b8',
-                'accent': '#0ea5e9',
-                'warning': '#f59e0b',
-                'error': '#ef4444',
-                'success': '#10b981'
-            })
-        }
+        
+        # Garantisce il salvataggio di un eventuale cambio tema ancora in attesa
+        app = QApplication.instance()
+        if app:
+            app.aboutToQuit.connect(self._flush_save)
     
     def get_current_theme(self):
         """Restituisce il tema corrente."""
@@ -139,6 +627,10 @@ class ThemeManager(QObject):
         Args:
             theme_variant (ThemeVariant): Variante del tema da applicare
         """
+        # Nessun salvataggio né segnale se il tema è già quello corrente
+        if theme_variant == self.current_theme:
+            return
+        
         if theme_variant in self.themes:
             self.current_theme = theme_variant
             self._save_theme()
@@ -153,11 +645,23 @@ class ThemeManager(QObject):
         return self.themes[theme_variant].name if theme_variant in self.themes else ""
     
     def _save_theme(self):
-        """Salva il tema corrente nel file di configurazione."""
+        """Pianifica il salvataggio del tema corrente, accorpando i cambi ravvicinati."""
+        if not self._save_pending:
+            self._save_pending = True
+            QTimer.singleShot(self.SAVE_DELAY_MS, self._flush_save)
+    
+    def _flush_save(self):
+        """Salva il tema corrente nel file di configurazione con scrittura atomica."""
+        self._save_pending = False
+        if self.current_theme == self._saved_theme:
+            return
+        
         try:
-            settings = {'current_theme': self.current_theme.value}
-            with open(self.settings_file, 'w') as f:
-                json.dump(settings, f)
+            temp_file = self.settings_file + '.tmp'
+            with open(temp_file, 'wb') as f:
+                f.write(_ENCODED_SETTINGS[self.current_theme])
+            os.replace(temp_file, self.settings_file)
+            self._saved_theme = self.current_theme
         except Exception:
             pass  # Ignora errori di salvataggio
     
@@ -165,229 +669,41 @@ class ThemeManager(QObject):
         """Carica il tema salvato dal file di configurazione."""
         try:
             if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r') as f:
-                    settings = json.load(f)
-                    theme_value = settings.get('current_theme', 'light')
-                    for variant in ThemeVariant:
-                        if variant.value == theme_value:
-                            self.current_theme = variant
-                            break
+                mtime = os.path.getmtime(self.settings_file)
+                variant = _read_settings(self.settings_file, mtime)
+                if variant is not None:
+                    self.current_theme = variant
+                    self._saved_theme = variant
         except Exception:
             pass  # Usa tema di default in caso di errore
     
     def get_main_window_style(self):
         """Restituisce lo stile CSS per la finestra principale."""
-        theme = self.get_current_theme()
-        return f"""
-            QMainWindow {{
-                background-color: {theme.background};
-                color: {theme.text_primary};
-            }}
-            
-            QMainWindow::separator {{
-                background-color: {theme.border};
-                width: 1px;
-                height: 1px;
-            }}
-        """
+        return self.get_current_theme().style('main_window')
     
     def get_toolbar_style(self):
         """Restituisce lo stile CSS per la toolbar."""
-        theme = self.get_current_theme()
-        return f"""
-            QToolBar {{
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                          stop: 0 {theme.surface}, stop: 1 {theme.surface_alt});
-                border: none;
-                border-bottom: 2px solid {theme.border};
-                spacing: 8px;
-                padding: 8px 12px;
-                font-weight: 500;
-            }}
-            
-            QToolBar::separator {{
-                background-color: {theme.border};
-                width: 1px;
-                margin: 4px 8px;
-            }}
-            
-            QToolBar QToolButton {{
-                background-color: transparent;
-                border: 2px solid transparent;
-                border-radius: 8px;
-                padding: 8px 16px;
-                margin: 2px;
-                font-size: 11pt;
-                font-weight: 500;
-                color: {theme.text_primary};
-                min-width: 80px;
-                min-height: 32px;
-            }}
-            
-            QToolBar QToolButton:hover {{
-                background-color: {theme.secondary_hover};
-                border-color: {theme.border_hover};
-            }}
-            
-            QToolBar QToolButton:pressed {{
-                background-color: {theme.secondary_pressed};
-                border-color: {theme.primary};
-            }}
-            
-            QToolBar QToolButton:disabled {{
-                color: {theme.text_disabled};
-                background-color: transparent;
-                border-color: transparent;
-            }}
-            
-            QToolBar QToolButton[primary="true"] {{
-                background-color: {theme.primary};
-                color: white;
-                border-color: {theme.primary};
-                font-weight: bold;
-            }}
-            
-            QToolBar QToolButton[primary="true"]:hover {{
-                background-color: {theme.primary_hover};
-            }}
-            
-            QToolBar QToolButton[primary="true"]:pressed {{
-                background-color: {theme.primary_pressed};
-            }}
-            
-            QToolBar QToolButton[primary="true"]:disabled {{
-                background-color: {theme.text_disabled};
-                border-color: {theme.text_disabled};
-            }}
-        """
+        return self.get_current_theme().style('toolbar')
     
     def get_groupbox_style(self):
         """Restituisce lo stile CSS per i QGroupBox."""
-        theme = self.get_current_theme()
-        return f"""
-            QGroupBox {{
-                font-weight: 600;
-                font-size: 12pt;
-                border: 2px solid {theme.border};
-                border-radius: 12px;
-                margin: 15px 0px;
-                padding-top: 20px;
-                background-color: {theme.surface};
-                color: {theme.text_primary};
-            }}
-            
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 20px;
-                padding: 0 15px 0 15px;
-                background-color: {theme.surface};
-                color: {theme.primary};
-                font-weight: bold;
-            }}
-        """
+        return self.get_current_theme().style('groupbox')
     
     def get_lineedit_style(self):
         """Restituisce lo stile CSS per i QLineEdit."""
-        theme = self.get_current_theme()
-        return f"""
-            QLineEdit {{
-                border: 2px solid {theme.border};
-                border-radius: 8px;
-                padding: 12px 16px;
-                font-size: 11pt;
-                background-color: {theme.background};
-                color: {theme.text_primary};
-                selection-background-color: {theme.primary};
-                selection-color: white;
-            }}
-            
-            QLineEdit:focus {{
-                border-color: {theme.primary};
-                background-color: {theme.background};
-            }}
-            
-            QLineEdit:disabled {{
-                background-color: {theme.surface_alt};
-                color: {theme.text_disabled};
-                border-color: {theme.border};
-            }}
-            
-            QLineEdit[readOnly="true"] {{
-                background-color: {theme.surface_alt};
-                color: {theme.text_secondary};
-                border: 2px solid {theme.border};
-                font-style: italic;
-                border-radius: 8px;
-                padding: 12px 16px;
-            }}
-            
-            QLineEdit::placeholder {{
-                color: {theme.text_secondary};
-                font-style: italic;
-            }}
-        """
+        return self.get_current_theme().style('lineedit')
     
     def get_label_style(self):
         """Restituisce lo stile CSS per i QLabel."""
-        theme = self.get_current_theme()
-        return f"""
-            QLabel {{
-                color: {theme.text_primary};
-                font-size: 11pt;
-                font-weight: 500;
-            }}
-            
-            QLabel[header="true"] {{
-                font-size: 14pt;
-                font-weight: bold;
-                color: {theme.primary};
-            }}
-            
-            QLabel:disabled {{
-                color: {theme.text_disabled};
-            }}
-        """
+        return self.get_current_theme().style('label')
     
     def get_statusbar_style(self):
         """Restituisce lo stile CSS per la status bar."""
-        theme = self.get_current_theme()
-        return f"""
-            QStatusBar {{
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                          stop: 0 {theme.surface_alt}, stop: 1 {theme.surface});
-                border-top: 1px solid {theme.border};
-                padding: 8px 16px;
-                font-size: 10pt;
-                color: {theme.text_secondary};
-            }}
-            
-            QStatusBar::item {{
-                border: none;
-            }}
-        """
+        return self.get_current_theme().style('statusbar')
     
     def get_dialog_style(self):
         """Restituisce lo stile CSS per i dialog."""
-        theme = self.get_current_theme()
-        return f"""
-            QDialog {{
-                background-color: {theme.background};
-                color: {theme.text_primary};
-            }}
-            
-            QTextEdit {{
-                border: 2px solid {theme.border};
-                border-radius: 8px;
-                background-color: {theme.surface};
-                padding: 16px;
-                font-size: 10pt;
-                color: {theme.text_primary};
-            }}
-            
-            QTextEdit:focus {{
-                border-color: {theme.primary};
-            }}
-        """
+        return self.get_current_theme().style('dialog')
     
     def get_button_style(self, primary=False):
         """
@@ -396,145 +712,40 @@ class ThemeManager(QObject):
         Args:
             primary (bool): Se True, restituisce lo stile per bottone primario
         """
-        theme = self.get_current_theme()
-        
-        if primary:
-            return f"""
-                QPushButton {{
-                    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                              stop: 0 {theme.primary}, stop: 1 {theme.primary_pressed});
-                    color: white;
-                    border: none;
-                    border-radius: 8px;
-                    font-weight: bold;
-                    font-size: 11pt;
-                    padding: 12px 20px;
-                    min-width: 100px;
-                    min-height: 40px;
-                }}
-                
-                QPushButton:hover {{
-                    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                              stop: 0 {theme.primary_hover}, stop: 1 {theme.primary});
-                }}
-                
-                QPushButton:pressed {{
-                    background-color: {theme.primary_pressed};
-                }}
-                
-                QPushButton:disabled {{
-                    background-color: {theme.text_disabled};
-                    color: {theme.surface};
-                }}
-            """
-        else:
-            return f"""
-                QPushButton {{
-                    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                              stop: 0 {theme.secondary}, stop: 1 {theme.secondary_hover});
-                    color: {theme.text_primary};
-                    border: 2px solid {theme.border};
-                    border-radius: 8px;
-                    font-size: 11pt;
-                    font-weight: 500;
-                    padding: 12px 20px;
-                    min-width: 100px;
-                    min-height: 40px;
-                }}
-                
-                QPushButton:hover {{
-                    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                              stop: 0 {theme.secondary_hover}, stop: 1 {theme.secondary_pressed});
-                    border-color: {theme.border_hover};
-                }}
-                
-                QPushButton:pressed {{
-                    background-color: {theme.secondary_pressed};
-                    border-color: {theme.primary};
-                }}
-                
-                QPushButton:disabled {{
-                    background-color: {theme.surface_alt};
-                    color: {theme.text_disabled};
-                    border-color: {theme.border};
-                }}
-            """
+        return self.get_current_theme().style('primary_button' if primary else 'button')
     
     def get_menu_style(self):
         """Restituisce lo stile CSS per i menu."""
-        theme = self.get_current_theme()
-        return f"""
-            QMenuBar {{
-                background-color: {theme.surface};
-                color: {theme.text_primary};
-                border-bottom: 1px solid {theme.border};
-                padding: 4px 8px;
-                font-size: 11pt;
-            }}
-            
-            QMenuBar::item {{
-                background-color: transparent;
-                padding: 8px 12px;
-                border-radius: 4px;
-            }}
-            
-            QMenuBar::item:selected {{
-                background-color: {theme.secondary_hover};
-                color: {theme.text_primary};
-            }}
-            
-            QMenuBar::item:pressed {{
-                background-color: {theme.secondary_pressed};
-            }}
-            
-            QMenu {{
-                background-color: {theme.background};
-                border: 2px solid {theme.border};
-                border-radius: 8px;
-                padding: 8px 0px;
-                color: {theme.text_primary};
-            }}
-            
-            QMenu::item {{
-                padding: 8px 20px;
-                background-color: transparent;
-            }}
-            
-            QMenu::item:selected {{
-                background-color: {theme.secondary_hover};
-                color: {theme.text_primary};
-            }}
-            
-            QMenu::separator {{
-                height: 1px;
-                background-color: {theme.border};
-                margin: 4px 12px;
-            }}
+        return self.get_current_theme().style('menu')
+    
+    def get_full_stylesheet(self):
         """
+        Restituisce il foglio di stile completo del tema corrente.
+        
+        Tutti i frammenti sono concatenati in un'unica stringa, così Qt
+        esegue il parsing una sola volta per cambio tema.
+        """
+        return self.get_current_theme().full_stylesheet
     
     def apply_theme_to_application(self, app):
         """
-        Applica il tema all'intera applicazione.
+        Applica il tema all'intera applicazione (palette e foglio di stile).
+        
+        Gli aggiornamenti delle finestre sono sospesi durante l'applicazione,
+        così Qt esegue un solo ridisegno invece di uno per ogni operazione.
         
         Args:
             app (QApplication): Istanza dell'applicazione
         """
         theme = self.get_current_theme()
+        windows = app.topLevelWidgets()
         
-        # Imposta palette dell'applicazione
-        palette = QPalette()
-        palette.setColor(QPalette.ColorRole.Window, QColor(theme.background))
-        palette.setColor(QPalette.ColorRole.WindowText, QColor(theme.text_primary))
-        palette.setColor(QPalette.ColorRole.Base, QColor(theme.surface))
-        palette.setColor(QPalette.ColorRole.AlternateBase, QColor(theme.surface_alt))
-        palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(theme.surface))
-        palette.setColor(QPalette.ColorRole.ToolTipText, QColor(theme.text_primary))
-        palette.setColor(QPalette.ColorRole.Text, QColor(theme.text_primary))
-        palette.setColor(QPalette.ColorRole.Button, QColor(theme.secondary))
-        palette.setColor(QPalette.ColorRole.ButtonText, QColor(theme.text_primary))
-        palette.setColor(QPalette.ColorRole.BrightText, QColor(theme.error))
-        palette.setColor(QPalette.ColorRole.Link, QColor(theme.primary))
-        palette.setColor(QPalette.ColorRole.Highlight, QColor(theme.primary))
-        palette.setColor(QPalette.ColorRole.HighlightedText, QColor('#ffffff'))
-        
-        app.setPalette(palette)
\ No newline at end of file
+        for window in windows:
+            window.setUpdatesEnabled(False)
+        try:
+            app.setPalette(theme.palette)
+            app.setStyleSheet(theme.full_stylesheet)
+        finally:
+            for window in windows:
+                window.setUpdatesEnabled(True)
+                window.update()
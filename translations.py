@@ -2,314 +2,253 @@
 """
 Modulo per la gestione delle traduzioni multilingua dell'applicazione PDF Tools.
 Supporta italiano e inglese con possibilità di aggiungere altre lingue.
+
+I testi di ogni lingua sono nella directory 'locales' (translations_<lingua>.json
+e about_<lingua>.html) e vengono caricati solo quando servono. L'inglese è la
+lingua di base: gli altri cataloghi contengono solo i testi che ne differiscono.
 """
 
+import json
+import os
+import sys
+from string import Formatter
+
+# Directory contenente i cataloghi di traduzione
+_LOCALES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'locales')
+
+# Lingue disponibili
+_LANGS = ('it', 'en')
+
+# Lingua di base, usata per i testi non presenti negli altri cataloghi
+_BASE_LANG = 'en'
+
+# Indice di ogni chiave nelle tabelle, ricavato dal catalogo di base
+_KEY_IDX = {}
+
+# Tabelle dei testi già caricate (una tupla per lingua, allineata a _KEY_IDX),
+# condivise da tutte le istanze di Translations
+_TABLES = {}
+
+# Testi HTML delle informazioni già caricati, per lingua
+_ABOUT_CACHE = {}
+
+
+def _catalog_pairs(pairs):
+    """
+    Costruisce un catalogo dalle coppie lette dal JSON, rifiutando le chiavi
+    duplicate (json le sovrascriverebbe in silenzio).
+    
+    Args:
+        pairs (list): Coppie (chiave, testo) nell'ordine del file
+        
+    Returns:
+        dict: Catalogo con chiavi internate
+    """
+    catalog = {}
+    for key, text in pairs:
+        if key in catalog:
+            raise ValueError(f"Duplicate translation key: {key}")
+        # Chiavi internate: le ricerche in get() confrontano per identità
+        catalog[sys.intern(key)] = text
+    return catalog
+
+
+def _load_catalog(language):
+    """
+    Legge il file JSON di una lingua.
+    
+    Args:
+        language (str): Codice lingua
+        
+    Returns:
+        dict: Testi presenti nel file
+    """
+    path = os.path.join(_LOCALES_DIR, f'translations_{language}.json')
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f, object_pairs_hook=_catalog_pairs)
+
+
+def _get_table(language):
+    """
+    Restituisce la tabella dei testi di una lingua, costruendola se necessario.
+    
+    La prima chiamata carica il catalogo di base e ne ricava _KEY_IDX. Le altre
+    lingue riprendono dalla base i testi che non ridefiniscono; per una lingua
+    non disponibile la tabella contiene le chiavi stesse.
+    
+    Args:
+        language (str): Codice lingua
+        
+    Returns:
+        tuple: Testi della lingua, nell'ordine di _KEY_IDX
+    """
+    table = _TABLES.get(language)
+    if table is not None:
+        return table
+    
+    base = _TABLES.get(_BASE_LANG)
+    if base is None:
+        catalog = _load_catalog(_BASE_LANG)
+        _KEY_IDX.update((key, index) for index, key in enumerate(catalog))
+        base = _TABLES[_BASE_LANG] = tuple(catalog.values())
+    
+    if language == _BASE_LANG:
+        return base
+    
+    if language in _LANGS:
+        overrides = _load_catalog(language)
+        table = tuple(overrides.get(key, text) for key, text in zip(_KEY_IDX, base))
+    else:
+        table = tuple(_KEY_IDX)
+    
+    _TABLES[language] = table
+    return table
+
+
+def _load_about(language):
+    """
+    Carica il testo HTML delle informazioni, al primo utilizzo.
+    
+    Il testo resta fuori dai cataloghi, così le ricerche comuni non lo toccano.
+    
+    Args:
+        language (str): Codice lingua
+        
+    Returns:
+        str: Testo HTML, o None se non disponibile
+    """
+    text = _ABOUT_CACHE.get(language)
+    if text is None and language in _LANGS:
+        path = os.path.join(_LOCALES_DIR, f'about_{language}.html')
+        with open(path, 'r', encoding='utf-8') as f:
+            text = _ABOUT_CACHE[language] = f.read()
+    return text
+
+
+def _compile_format(text):
+    """
+    Scompone una stringa di formato in parti riutilizzabili.
+    
+    Args:
+        text (str): Testo con segnaposto
+        
+    Returns:
+        tuple: Coppie (testo letterale, segue un segnaposto), oppure None se il
+            testo usa campi numerati, con nome o con specifiche di formato
+    """
+    parts = []
+    for literal, field, spec, conversion in Formatter().parse(text):
+        if field is not None and (field or spec or conversion):
+            return None
+        parts.append((literal, field is not None))
+    return tuple(parts)
+
+
+def _fast_format(parts, args):
+    """
+    Applica gli argomenti a una stringa di formato già scomposta.
+    
+    Args:
+        parts (tuple): Parti restituite da _compile_format
+        args (tuple): Argomenti posizionali
+        
+    Returns:
+        str: Testo formattato
+    """
+    pieces = []
+    index = 0
+    for literal, has_field in parts:
+        pieces.append(literal)
+        if has_field:
+            pieces.append(format(args[index]))
+            index += 1
+    return ''.join(pieces)
+
+
 class Translations:
     """Gestisce le traduzioni per l'applicazione."""
     
+    __slots__ = ('language', 'get', 'fmt', '_table', '_memo', '_fmt_cache')
+    
     def __init__(self, language='it'):
         self.language = language
-        self.translations = {
-            'it': {
-                # Titoli finestre
-                'app_title': 'PDF Tools',
-                'about_title': 'Informazioni',
-                
-                # Menu
-                'file_menu': 'File',
-                'help_menu': '?',
-                'language_menu': 'Lingua',
-                'tools_menu': 'Strumenti',
-                
-                # Azioni menu strumenti
-                'open_output_folder': 'Apri Cartella Output',
-                'output_statistics': 'Statistiche Output',
-                'cleanup_old_files': 'Pulisci File Vecchi',
-                'configure_output': 'Configura Directory Output',
-                
-                # Directory output
-                'output_directory': 'Directory Output',
-                'select_output_directory': 'Seleziona Directory Output',
-                'output_directory_changed': 'Directory output cambiata: {}',
-                'creating_output_structure': 'Creazione struttura directory...',
-                'output_structure_created': 'Struttura directory creata.',
-                
-                # Statistiche
-                'statistics_title': 'Statistiche File Output',
-                'total_files': 'File totali: {}',
-                'total_size': 'Dimensione totale: {} MB',
-                'files_by_type': 'File per tipo',
-                'cleanup_completed': 'Pulizia completata: {} file eliminati ({} MB liberati)',
-                'tools_menu': 'Strumenti',
-                
-                # Azioni menu
-                'browse': 'Sfoglia',
-                'compress': 'Comprimi',
-                'merge': 'Unisci',
-                'protect': 'Proteggi',
-                'remove_protection': 'Rimuovi Password',
-                'add_watermark': 'Aggiungi Filigrana',
-                'clear_fields': 'Cancella Campi',
-                'exit': 'Esci',
-                'about': 'Informazioni',
-                'italian': 'Italiano',
-                'english': 'English',
-                
-                # Labels
-                'input_file': 'File di input',
-                'output_file': 'Nome file output',
-                'output_directory': 'Directory di Output',
-                'password': 'Password',
-                'watermark': 'Filigrana',
-                
-                # Bottoni
-                'browse_btn': 'Sfoglia',
-                'compress_btn': 'Comprimi',
-                'merge_btn': 'Unisci',
-                'protect_btn': 'Proteggi',
-                'remove_protection_btn': 'Rimuovi Password',
-                'watermark_btn': 'Filigrana',
-                'clear_btn': 'Cancella Campi',
-                
-                # Messaggi
-                'ready': 'Pronto...',
-                'file_selected': 'File selezionato: {}',
-                'success': 'Successo',
-                'error': 'Errore',
-                'warning': 'Attenzione',
-                
-                # Errori e avvisi
-                'no_file_selected': 'Seleziona un file PDF.',
-                'no_files_selected': 'Seleziona almeno un file PDF da unire.',
-                'no_output_name': 'Specifica un nome per il file di output.',
-                'no_password': 'Specifica una password.',
-                'no_watermark_text': 'Specifica un testo per la filigrana.',
-                
-                # Successi
-                'compressed_success': 'PDF compresso e salvato in "{}".',
-                'merged_success': 'PDF unito e salvato in "{}".',
-                'protected_success': 'PDF protetto e salvato in "{}".',
-                'unprotected_success': 'Protezione rimossa e salvato in "{}".',
-                'watermark_success': 'Filigrana aggiunta e salvato in "{}".',
-                
-                # Errori operazioni
-                'compression_error': 'Errore durante la compressione: {}',
-                'merge_error': 'Errore durante l\'unione: {}',
-                'protection_error': 'Errore durante la protezione: {}',
-                'unprotection_error': 'Errore durante la rimozione protezione: {}',
-                'watermark_error': 'Errore durante l\'aggiunta filigrana: {}',
-                
-                # Temi
-                'theme_menu': 'Tema',
-                'light_theme': 'Chiaro Professionale',
-                'dark_theme': 'Scuro Professionale', 
-                'blue_theme': 'Blu Aziendale',
-                
-                # Messaggi operazioni
-                'compressing': 'Compressione in corso...',
-                'merging': 'Unione in corso...',
-                'protecting': 'Protezione in corso...',
-                'removing_protection': 'Rimozione protezione...',
-                'adding_watermark': 'Aggiunta filigrana...',
-                'operation_completed': 'Operazione completata.',
-                'operation_failed': 'Operazione fallita',
-                'fields_cleared': 'Campi cancellati.',
-                
-                # Dialog file
-                'select_pdf': 'Seleziona file PDF',
-                'select_pdfs_to_merge': 'Seleziona PDF da unire',
-                'save_merged_pdf': 'Salva PDF unito',
-                'file_not_found': 'File non trovato.',
-                'invalid_pdf': 'File PDF non valido.',
-                'input_file_placeholder': 'Seleziona un file PDF...',
-                'output_file_placeholder': 'Nome file output...',
-                'output_directory_placeholder': 'I file verranno salvati automaticamente nella directory output...',
-                'password_placeholder': 'Inserisci password...',
-                'watermark_placeholder': 'Inserisci testo filigrana...',
-                'opening_output_folder': 'Apertura cartella output...',
-                
-                # About dialog
-                'about_text': '''
-                <h2 style="color: #0078d4; text-align: center;">PDF Tools</h2>
-                <p><b>Versione:</b> 2.0.0 Professional</p>
-                <p><b>Descrizione:</b> Applicazione professionale per la gestione dei file PDF con interfaccia moderna e temi personalizzabili.</p>
-                
-                <h3 style="color: #0078d4;">Funzionalità:</h3>
-                <ul>
-                <li>🗜️ Compressione PDF avanzata per ridurre le dimensioni</li>
-                <li>🔗 Unione di più file PDF</li>
-                <li>🔒 Protezione con password sicura</li>
-                <li>🔓 Rimozione protezione</li>
-                <li>🖋️ Aggiunta filigrane personalizzate</li>
-                <li>🎨 Tre temi professionali (Chiaro, Scuro, Blu)</li>
-                <li>🌐 Interfaccia multilingua (IT/EN)</li>
-                </ul>
-                
-                <p><b>Sviluppato da:</b> Alessandro Castaldi</p>
-                <p><b>Email:</b> notifiche72@gmail.com</p>
-                <p><b>Sito web:</b> https://unpoditutto.info/</p>
-                
-                <p style="text-align: center;"><i>Copyright © 2025 Alessandro Castaldi. Tutti i diritti riservati.</i></p>
-                '''
-            },
-            'en': {
-                # Window titles
-                'app_title': 'PDF Tools',
-                'about_title': 'About',
-                
-                # Menu
-                'file_menu': 'File',
-                'help_menu': 'Help',
-                'language_menu': 'Language',
-                'tools_menu': 'Tools',
-                
-                # Tools menu actions
-                'open_output_folder': 'Open Output Folder',
-                'output_statistics': 'Output Statistics',
-                'cleanup_old_files': 'Cleanup Old Files',
-                'configure_output': 'Configure Output Directory',
-                
-                # Output directory
-                'output_directory': 'Output Directory',
-                'select_output_directory': 'Select Output Directory',
-                'output_directory_changed': 'Output directory changed: {}',
-                'creating_output_structure': 'Creating directory structure...',
-                'output_structure_created': 'Directory structure created.',
-                
-                # Statistics
-                'statistics_title': 'Output Files Statistics',
-                'total_files': 'Total files: {}',
-                'total_size': 'Total size: {} MB',
-                'files_by_type': 'Files by type',
-                'cleanup_completed': 'Cleanup completed: {} files deleted ({} MB freed)',
-                
-                # Menu actions
-                'browse': 'Browse',
-                'compress': 'Compress',
-                'merge': 'Merge',
-                'protect': 'Protect',
-                'remove_protection': 'Remove Password',
-                'add_watermark': 'Add Watermark',
-                'clear_fields': 'Clear Fields',
-                'exit': 'Exit',
-                'about': 'About',
-                'italian': 'Italiano',
-                'english': 'English',
-                
-                # Labels
-                'input_file': 'Input File',
-                'output_file': 'Output filename',
-                'output_directory': 'Output Directory',
-                'password': 'Password',
-                'watermark': 'Watermark',
-                
-                # Buttons
-                'browse_btn': 'Browse',
-                'compress_btn': 'Compress',
-                'merge_btn': 'Merge',
-                'protect_btn': 'Protect',
-                'remove_protection_btn': 'Remove Password',
-                'watermark_btn': 'Watermark',
-                'clear_btn': 'Clear Fields',
-                
-                # Messages
-                'ready': 'Ready...',
-                'file_selected': 'File selected: {}',
-                'success': 'Success',
-                'error': 'Error',
-                'warning': 'Warning',
-                
-                # Errors and warnings
-                'no_file_selected': 'Select a PDF file.',
-                'no_files_selected': 'Select at least one PDF file to merge.',
-                'no_output_name': 'Specify a name for the output file.',
-                'no_password': 'Specify a password.',
-                'no_watermark_text': 'Specify watermark text.',
-                
-                # Success messages
-                'compressed_success': 'PDF compressed and saved as "{}".',
-                'merged_success': 'PDF merged and saved as "{}".',
-                'protected_success': 'PDF protected and saved as "{}".',
-                'unprotected_success': 'Protection removed and saved as "{}".',
-                'watermark_success': 'Watermark added and saved as "{}".',
-                
-                # Operation errors
-                'compression_error': 'Error during compression: {}',
-                'merge_error': 'Error during merge: {}',
-                'protection_error': 'Error during protection: {}',
-                'unprotection_error': 'Error during protection removal: {}',
-                'watermark_error': 'Error during watermark addition: {}',
-                
-                # Themes
-                'theme_menu': 'Theme',
-                'light_theme': 'Light Professional',
-                'dark_theme': 'Dark Professional',
-                'blue_theme': 'Corporate Blue',
-                
-                # Operation messages
-                'compressing': 'Compressing...',
-                'merging': 'Merging...',
-                'protecting': 'Protecting...',
-                'removing_protection': 'Removing protection...',
-                'adding_watermark': 'Adding watermark...',
-                'operation_completed': 'Operation completed.',
-                'operation_failed': 'Operation failed',
-                'fields_cleared': 'Fields cleared.',
-                
-                # File dialogs
-                'select_pdf': 'Select PDF file',
-                'select_pdfs_to_merge': 'Select PDFs to merge',
-                'save_merged_pdf': 'Save merged PDF',
-                'file_not_found': 'File not found.',
-                'invalid_pdf': 'Invalid PDF file.',
-                'input_file_placeholder': 'Select a PDF file...',
-                'output_file_placeholder': 'Output filename...',
-                'output_directory_placeholder': 'Files will be automatically saved in output directory...',
-                'password_placeholder': 'Enter password...',
-                'watermark_placeholder': 'Enter watermark text...',
-                'opening_output_folder': 'Opening output folder...',
-                
-                # About dialog
-                'about_text': '''
-                <h2 style="color: #0078d4; text-align: center;">PDF Tools</h2>
-                <p><b>Version:</b> 2.0.0 Professional</p>
-                <p><b>Description:</b> Professional application for PDF file management with modern interface and customizable themes.</p>
-                
-                <h3 style="color: #0078d4;">Features:</h3>
-                <ul>
-                <li>🗜️ Advanced PDF compression to reduce file size</li>
-                <li>🔗 Merge multiple PDF files</li>
-                <li>🔒 Secure password protection</li>
-                <li>🔓 Remove protection</li>
-                <li>🖋️ Add custom watermarks</li>
-                <li>🎨 Three professional themes (Light, Dark, Blue)</li>
-                <li>🌐 Multilingual interface (IT/EN)</li>
-                </ul>
-                
-                <p><b>Developed by:</b> Alessandro Castaldi</p>
-                <p><b>Email:</b> notifiche72@gmail.com</p>
-                <p><b>Website:</b> https://unpoditutto.info/</p>
-                
-                <p style="text-align: center;"><i>Copyright © 2025 Alessandro Castaldi. All rights reserved.</i></p>
-                '''
-            }
-        }
+        self._table = _get_table(language)
+        # Testi già risolti per le chiamate senza argomenti
+        self._memo = {}
+        # Stringhe di formato già scomposte, per chiave
+        self._fmt_cache = {}
+        self._bind_accessors()
     
-    def get(self, key, *args):
+    def _bind_accessors(self):
         """
-        Ottiene una traduzione per la chiave specificata.
+        Crea le funzioni get() e fmt() dell'istanza.
+        
+        Le funzioni accedono alle cache tramite variabili della closure, senza
+        leggere attributi di self a ogni chiamata. Le cache vengono svuotate
+        sul posto da set_language(), quindi le stesse funzioni restano valide
+        anche dopo un cambio di lingua.
+        """
+        memo = self._memo
+        fmt_cache = self._fmt_cache
+        lookup = self._lookup
+        
+        def get(key):
+            """
+            Ottiene una traduzione per la chiave specificata.
+            
+            Args:
+                key (str): Chiave della traduzione
+            
+            Returns:
+                str: Testo tradotto
+            """
+            try:
+                return memo[key]
+            except KeyError:
+                text = memo[key] = lookup(key)
+                return text
+        
+        def fmt(key, *args):
+            """
+            Ottiene una traduzione con segnaposto e la formatta.
+            
+            Args:
+                key (str): Chiave della traduzione
+                *args: Argomenti per la formattazione della stringa
+            
+            Returns:
+                str: Testo tradotto e formattato
+            """
+            try:
+                parts = fmt_cache[key]
+            except KeyError:
+                parts = fmt_cache[key] = _compile_format(lookup(key))
+            
+            if parts is None:
+                return lookup(key).format(*args)
+            return _fast_format(parts, args)
+        
+        self.get = get
+        self.fmt = fmt
+    
+    def _lookup(self, key):
+        """
+        Cerca il testo di una chiave nella tabella della lingua attiva.
         
         Args:
             key (str): Chiave della traduzione
-            *args: Argomenti per la formattazione della stringa
             
         Returns:
-            str: Testo tradotto
+            str: Testo tradotto, o la chiave stessa se non trovata
         """
-        text = self.translations.get(self.language, {}).get(key, key)
-        if args:
-            return text.format(*args)
-        return text
+        index = _KEY_IDX.get(key)
+        if index is not None:
+            return self._table[index]
+        
+        text = None
+        if key == 'about_text':
+            text = _load_about(self.language)
+        return key if text is None else text
     
     def set_language(self, language):
         """
@@ -318,14 +257,17 @@ class Translations:
         Args:
             language (str): Codice lingua ('it' o 'en')
         """
-        if language in self.translations:
+        if language in _LANGS:
             self.language = language
+            self._table = _get_table(language)
+            self._memo.clear()
+            self._fmt_cache.clear()
     
     def get_available_languages(self):
         """
         Restituisce le lingue disponibili.
         
         Returns:
-            list: Lista delle lingue disponibili
+            tuple: Codici delle lingue disponibili
         """
-        return list(self.translations.keys())
\ No newline at end of file
+        return _LANGS
\ No newline at end of file
@@ -5,22 +5,58 @@ Interfaccia moderna, responsiva e completamente tematizzabile.
 """
 
 from PyQt6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QLabel, QPushButton, QLineEdit, QStatusBar, QFrame,
-    QGroupBox, QSizePolicy, QSpacerItem, QDialog, QTextEdit,
+    QApplication, QWidget, QVBoxLayout, QFormLayout,
+    QLabel, QLineEdit, QStatusBar, QGroupBox,
     QToolBar, QToolButton
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSize
-from PyQt6.QtGui import QFont, QPalette, QColor, QAction, QIcon
+from PyQt6.QtCore import Qt, QEvent, QSignalBlocker, QTimer, QSize
 from theme_manager import ThemeManager, ThemeVariant
 
 
+# Testi di fallback in inglese, usati quando non sono disponibili traduzioni
+_FALLBACK_TEXTS = {
+    'app_title': 'PDF Tools',
+    'file_selection': 'File Selection',
+    'options': 'Options',
+    'input_file': 'Input File:',
+    'output_file': 'Output File:',
+    'output_directory': 'Output Directory:',
+    'password': 'Password:',
+    'watermark': 'Watermark:',
+    'input_file_placeholder': 'Select a PDF file...',
+    'output_file_placeholder': 'Output filename...',
+    'output_directory_placeholder': 'Files will be automatically saved in output directory...',
+    'password_placeholder': 'Enter password...',
+    'watermark_placeholder': 'Enter watermark text...',
+    'browse_btn': 'Browse',
+    'compress_btn': 'Compress',
+    'merge_btn': 'Merge',
+    'protect_btn': 'Protect',
+    'remove_protection_btn': 'Remove Password',
+    'watermark_btn': 'Add Watermark',
+    'clear_btn': 'Clear Fields',
+    'ready': 'Ready...',
+    'about_title': 'About',
+    'close': 'Close'
+}
+
+
+# Bottoni della toolbar; il nome del widget coincide con la chiave del testo
+_TOOLBAR_BUTTON_NAMES = (
+    'browse_btn', 'compress_btn', 'merge_btn', 'protect_btn',
+    'remove_protection_btn', 'watermark_btn', 'clear_btn'
+)
+
+
 class ModernToolButton(QToolButton):
     """Bottone toolbar con stile moderno e personalizzabile."""
     
     def __init__(self, text, primary=False, parent=None):
         super().__init__(parent)
         self.primary = primary
+        # Dimensioni suggerite già calcolate, invalidate al cambio di testo o stile
+        self._cached_hint = None
+        self._cached_min_hint = None
         self.setText(text)
         self.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextOnly)
         self.setAutoRaise(True)
@@ -28,66 +64,34 @@ class ModernToolButton(QToolButton):
         
         if primary:
             self.setProperty("primary", "true")
-
-
-class AboutDialog(QDialog):
-    """Dialog moderno per le informazioni sull'applicazione con supporto temi."""
     
-    def __init__(self, translations=None, theme_manager=None, parent=None):
-        super().__init__(parent)
-        self.translations = translations
-        self.theme_manager = theme_manager
-        self.setup_ui()
-        self.apply_theme()
-    
-    def setup_ui(self):
-        """Configura l'interfaccia del dialog."""
-        self.setWindowTitle(self._get_text('about_title'))
-        self.setFixedSize(550, 450)
-        self.setModal(True)
-        
-        layout = QVBoxLayout(self)
-        layout.setSpacing(25)
-        layout.setContentsMargins(40, 40, 40, 40)
-        
-        # Titolo principale
-        title_label = QLabel("PDF Tools")
-        title_label.setProperty("header", "true")
-        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Area di testo per le informazioni
-        text_area = QTextEdit(self)
-        text_area.setHtml(self._get_text('about_text'))
-        text_area.setReadOnly(True)
-        text_area.setMaximumHeight(280)
-        
-        # Bottone chiudi
-        close_button = QPushButton(self._get_text('close') if self.translations else 'Close')
-        close_button.clicked.connect(self.accept)
-        close_button.setMinimumWidth(120)
-        
-        button_layout = QHBoxLayout()
-        button_layout.addStretch()
-        button_layout.addWidget(close_button)
-        
-        layout.addWidget(title_label)
-        layout.addWidget(text_area)
-        layout.addLayout(button_layout)
-    
-    def apply_theme(self):
-        """Applica il tema corrente al dialog."""
-        if self.theme_manager:
-            self.setStyleSheet(
-                self.theme_manager.get_dialog_style() +
-                self.theme_manager.get_button_style(primary=True) +
-                self.theme_manager.get_label_style()
-            )
+    def _invalidate_hints(self):
+        """Scarta le dimensioni suggerite memorizzate."""
+        self._cached_hint = None
+        self._cached_min_hint = None
     
-    def _get_text(self, key):
-        """Helper per ottenere testo tradotto."""
-        if self.translations:
-            return self.translations.get(key)
-        return key
+    def setText(self, text):
+        """Imposta il testo del bottone e invalida le dimensioni suggerite."""
+        self._invalidate_hints()
+        super().setText(text)
+    
+    def sizeHint(self):
+        """Dimensione suggerita, calcolata una sola volta finché non cambia."""
+        if self._cached_hint is None:
+            self._cached_hint = super().sizeHint()
+        return self._cached_hint
+    
+    def minimumSizeHint(self):
+        """Dimensione minima suggerita, calcolata una sola volta finché non cambia."""
+        if self._cached_min_hint is None:
+            self._cached_min_hint = super().minimumSizeHint()
+        return self._cached_min_hint
+    
+    def changeEvent(self, event):
+        """Invalida le dimensioni suggerite quando cambiano stile o font."""
+        if event.type() in (QEvent.Type.StyleChange, QEvent.Type.FontChange):
+            self._invalidate_hints()
+        super().changeEvent(event)
 
 
 class UIManager:
@@ -96,6 +100,22 @@ class UIManager:
     con supporto temi e toolbar professionale.
     """
     
+    # Widget accessibili tramite get_widget()
+    WIDGET_NAMES = _TOOLBAR_BUTTON_NAMES + (
+        'input_file', 'output_file', 'password', 'watermark'
+    )
+    
+    # '__weakref__' serve a PyQt per connettere i metodi dell'istanza ai segnali
+    __slots__ = (
+        'main_window', 'translations', 'theme_manager', 'toolbar', 'status_bar',
+        '_toggleable_buttons', '_input_path', '_output_path', '_watermark_text',
+        '_app', '_texts', '_applied_theme', '_theme_apply_pending', '_about_dialog',
+        '__weakref__'
+    ) + WIDGET_NAMES
+    
+    # Ritardo (ms) con cui i cambi di tema ravvicinati vengono applicati
+    THEME_APPLY_DELAY_MS = 80
+    
     def __init__(self, main_window, translations=None, theme_manager=None):
         """
         Inizializza l'UI Manager.
@@ -108,17 +128,34 @@ class UIManager:
         self.main_window = main_window
         self.translations = translations
         self.theme_manager = theme_manager or ThemeManager()
+        self._app = QApplication.instance()
+        self._refresh_texts()
+        
+        # Riferimenti ai widgets, creati da setup_main_window()
+        for name in self.WIDGET_NAMES:
+            setattr(self, name, None)
         
-        # Riferimenti ai widgets
-        self.widgets = {}
-        self.layouts = {}
+        # Testi dei campi già ripuliti dagli spazi, aggiornati a ogni modifica
+        self._input_path = ''
+        self._output_path = ''
+        self._watermark_text = ''
         
         # Toolbar e status bar
         self.toolbar = None
         self.status_bar = None
         
+        # Bottoni disabilitati durante le operazioni, impostati da _create_toolbar()
+        self._toggleable_buttons = ()
+        
+        # Dialog informazioni, creato alla prima apertura e poi riutilizzato
+        self._about_dialog = None
+        
+        # Ultima variante del tema applicata
+        self._applied_theme = None
+        self._theme_apply_pending = False
+        
         # Connetti il cambio tema
-        self.theme_manager.theme_changed.connect(self.apply_current_theme)
+        self.theme_manager.theme_changed.connect(self._schedule_theme_apply)
         
     def setup_main_window(self):
         """Configura la finestra principale con il nuovo design."""
@@ -130,7 +167,7 @@ class UIManager:
         self._create_toolbar()
         
         # Crea il widget centrale
-        central_widget = QWidget()
+        central_widget = QWidget(self.main_window)
         self.main_window.setCentralWidget(central_widget)
         
         # Layout principale
@@ -153,137 +190,149 @@ class UIManager:
         
     def _create_toolbar(self):
         """Crea la toolbar professionale."""
-        self.toolbar = QToolBar("Main Toolbar")
+        self.toolbar = QToolBar("Main Toolbar", self.main_window)
         self.toolbar.setMovable(False)
         self.toolbar.setFloatable(False)
         self.toolbar.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextOnly)
         
         # Bottone sfoglia
-        self.widgets['browse_btn'] = ModernToolButton(self._get_text('browse_btn'))
-        self.toolbar.addWidget(self.widgets['browse_btn'])
+        self.browse_btn = ModernToolButton(self._get_text('browse_btn'), parent=self.toolbar)
+        self.toolbar.addWidget(self.browse_btn)
         
         self.toolbar.addSeparator()
         
         # Bottone comprimi (primario)
-        self.widgets['compress_btn'] = ModernToolButton(self._get_text('compress_btn'), primary=True)
-        self.toolbar.addWidget(self.widgets['compress_btn'])
+        self.compress_btn = ModernToolButton(self._get_text('compress_btn'), primary=True, parent=self.toolbar)
+        self.toolbar.addWidget(self.compress_btn)
         
         # Altri bottoni
-        self.widgets['merge_btn'] = ModernToolButton(self._get_text('merge_btn'))
-        self.toolbar.addWidget(self.widgets['merge_btn'])
+        self.merge_btn = ModernToolButton(self._get_text('merge_btn'), parent=self.toolbar)
+        self.toolbar.addWidget(self.merge_btn)
         
-        self.widgets['protect_btn'] = ModernToolButton(self._get_text('protect_btn'))
-        self.toolbar.addWidget(self.widgets['protect_btn'])
+        self.protect_btn = ModernToolButton(self._get_text('protect_btn'), parent=self.toolbar)
+        self.toolbar.addWidget(self.protect_btn)
         
         self.toolbar.addSeparator()
         
-        self.widgets['remove_protection_btn'] = ModernToolButton(self._get_text('remove_protection_btn'))
-        self.toolbar.addWidget(self.widgets['remove_protection_btn'])
+        self.remove_protection_btn = ModernToolButton(self._get_text('remove_protection_btn'), parent=self.toolbar)
+        self.toolbar.addWidget(self.remove_protection_btn)
         
-        self.widgets['watermark_btn'] = ModernToolButton(self._get_text('watermark_btn'))
-        self.toolbar.addWidget(self.widgets['watermark_btn'])
+        self.watermark_btn = ModernToolButton(self._get_text('watermark_btn'), parent=self.toolbar)
+        self.toolbar.addWidget(self.watermark_btn)
         
         self.toolbar.addSeparator()
         
         # Bottone cancella campi
-        self.widgets['clear_btn'] = ModernToolButton(self._get_text('clear_btn'))
-        self.toolbar.addWidget(self.widgets['clear_btn'])
+        self.clear_btn = ModernToolButton(self._get_text('clear_btn'), parent=self.toolbar)
+        self.toolbar.addWidget(self.clear_btn)
+        
+        self._toggleable_buttons = (
+            self.compress_btn, self.merge_btn, self.protect_btn,
+            self.remove_protection_btn, self.watermark_btn, self.clear_btn
+        )
         
         # Aggiungi la toolbar alla finestra
         self.main_window.addToolBar(Qt.ToolBarArea.TopToolBarArea, self.toolbar)
         
     def _create_file_section(self, parent_layout):
         """Crea la sezione per la selezione dei file con design migliorato."""
-        file_group = QGroupBox(self._get_text('file_selection'))
+        file_group = QGroupBox(self._get_text('file_selection'), parent_layout.parentWidget())
         
-        file_layout = QGridLayout(file_group)
+        file_layout = QFormLayout(file_group)
+        file_layout.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.AllNonFixedFieldsGrow)
         file_layout.setSpacing(20)
         file_layout.setContentsMargins(30, 35, 30, 30)
         
         # Input file con icona
-        input_label = QLabel(self._get_text('input_file'))
-        self.widgets['input_file'] = QLineEdit()
-        self.widgets['input_file'].setPlaceholderText(self._get_text('input_file_placeholder'))
+        input_label = QLabel(self._get_text('input_file'), file_group)
+        input_label.setMinimumWidth(150)
+        self.input_file = QLineEdit(file_group)
+        self.input_file.setPlaceholderText(self._get_text('input_file_placeholder'))
+        self.input_file.textChanged.connect(lambda text: setattr(self, '_input_path', text.strip()))
         
-        file_layout.addWidget(input_label, 0, 0)
-        file_layout.addWidget(self.widgets['input_file'], 0, 1)
+        file_layout.addRow(input_label, self.input_file)
         
         # Output directory info (non più editabile)
-        output_label = QLabel(self._get_text('output_directory'))
-        self.widgets['output_file'] = QLineEdit()
-        self.widgets['output_file'].setPlaceholderText(self._get_text('output_directory_placeholder'))
-        self.widgets['output_file'].setReadOnly(True)
+        output_label = QLabel(self._get_text('output_directory'), file_group)
+        output_label.setMinimumWidth(150)
+        self.output_file = QLineEdit(file_group)
+        self.output_file.setPlaceholderText(self._get_text('output_directory_placeholder'))
+        self.output_file.setReadOnly(True)
+        self.output_file.textChanged.connect(lambda text: setattr(self, '_output_path', text.strip()))
         # Rimuoviamo lo stile inline, sarà gestito dal theme manager
         
-        file_layout.addWidget(output_label, 1, 0)
-        file_layout.addWidget(self.widgets['output_file'], 1, 1)
-        
-        # Configura il layout delle colonne
-        file_layout.setColumnStretch(1, 1)
-        file_layout.setColumnMinimumWidth(0, 150)
+        file_layout.addRow(output_label, self.output_file)
         
         parent_layout.addWidget(file_group)
     
     def _create_options_section(self, parent_layout):
         """Crea la sezione per le opzioni con design migliorato."""
-        options_group = QGroupBox(self._get_text('options'))
+        options_group = QGroupBox(self._get_text('options'), parent_layout.parentWidget())
         
-        options_layout = QGridLayout(options_group)
+        options_layout = QFormLayout(options_group)
+        options_layout.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.AllNonFixedFieldsGrow)
         options_layout.setSpacing(20)
         options_layout.setContentsMargins(30, 35, 30, 30)
         
         # Password
-        password_label = QLabel(self._get_text('password'))
-        self.widgets['password'] = QLineEdit()
-        self.widgets['password'].setPlaceholderText(self._get_text('password_placeholder'))
-        self.widgets['password'].setEchoMode(QLineEdit.EchoMode.Password)
+        password_label = QLabel(self._get_text('password'), options_group)
+        password_label.setMinimumWidth(150)
+        self.password = QLineEdit(options_group)
+        self.password.setPlaceholderText(self._get_text('password_placeholder'))
+        self.password.setEchoMode(QLineEdit.EchoMode.Password)
         
-        options_layout.addWidget(password_label, 0, 0)
-        options_layout.addWidget(self.widgets['password'], 0, 1)
+        options_layout.addRow(password_label, self.password)
         
         # Watermark
-        watermark_label = QLabel(self._get_text('watermark'))
-        self.widgets['watermark'] = QLineEdit()
-        self.widgets['watermark'].setPlaceholderText(self._get_text('watermark_placeholder'))
-        
-        options_layout.addWidget(watermark_label, 1, 0)
-        options_layout.addWidget(self.widgets['watermark'], 1, 1)
+        watermark_label = QLabel(self._get_text('watermark'), options_group)
+        watermark_label.setMinimumWidth(150)
+        self.watermark = QLineEdit(options_group)
+        self.watermark.setPlaceholderText(self._get_text('watermark_placeholder'))
+        self.watermark.textChanged.connect(lambda text: setattr(self, '_watermark_text', text.strip()))
         
-        # Configura il layout delle colonne
-        options_layout.setColumnStretch(1, 1)
-        options_layout.setColumnMinimumWidth(0, 150)
+        options_layout.addRow(watermark_label, self.watermark)
         
         parent_layout.addWidget(options_group)
         
     def _create_status_bar(self):
         """Crea la status bar con design moderno."""
-        self.status_bar = QStatusBar()
+        self.status_bar = QStatusBar(self.main_window)
         self.main_window.setStatusBar(self.status_bar)
         self.show_status_message(self._get_text('ready'))
     
+    def _schedule_theme_apply(self):
+        """
+        Pianifica l'applicazione del tema dopo un cambio.
+        
+        I cambi ravvicinati vengono raggruppati: il tema viene applicato una
+        sola volta, con la variante corrente al termine del ritardo.
+        """
+        if not self._theme_apply_pending:
+            self._theme_apply_pending = True
+            QTimer.singleShot(self.THEME_APPLY_DELAY_MS, self._flush_theme_apply)
+    
+    def _flush_theme_apply(self):
+        """Applica il tema pianificato da _schedule_theme_apply."""
+        self._theme_apply_pending = False
+        self.apply_current_theme()
+    
     def apply_current_theme(self):
         """Applica il tema corrente a tutti i componenti."""
         if not self.theme_manager:
             return
-            
-        # Applica stili ai componenti
-        style_sheet = (
-            self.theme_manager.get_main_window_style() +
-            self.theme_manager.get_toolbar_style() +
-            self.theme_manager.get_groupbox_style() +
-            self.theme_manager.get_lineedit_style() +
-            self.theme_manager.get_label_style() +
-            self.theme_manager.get_statusbar_style() +
-            self.theme_manager.get_menu_style()
-        )
-        
-        self.main_window.setStyleSheet(style_sheet)
         
-        # Applica il tema all'applicazione
-        from PyQt6.QtWidgets import QApplication
-        app = QApplication.instance()
-        if app:
-            self.theme_manager.apply_theme_to_application(app)
+        # Nessun lavoro se la variante è già applicata
+        variant = self.theme_manager.current_theme
+        if variant == self._applied_theme:
+            return
+        self._applied_theme = variant
+        
+        # Il foglio di stile completo è applicato una sola volta all'applicazione
+        # ed è ereditato da tutte le finestre, dialog compresi
+        if self._app:
+            self.theme_manager.apply_theme_to_application(self._app)
+        else:
+            self.main_window.setStyleSheet(self.theme_manager.get_full_stylesheet())
     
     def get_widget(self, name):
         """
@@ -295,46 +344,53 @@ class UIManager:
         Returns:
             QWidget: Il widget richiesto o None
         """
-        return self.widgets.get(name)
+        if name in self.WIDGET_NAMES:
+            return getattr(self, name)
+        return None
     
     def get_input_file_path(self):
         """Ottiene il percorso del file di input."""
-        return self.widgets['input_file'].text().strip()
+        return self._input_path
     
     def set_input_file_path(self, path):
         """Imposta il percorso del file di input."""
-        self.widgets['input_file'].setText(path)
+        self.input_file.setText(path)
     
     def get_output_file_path(self):
         """Ottiene il percorso del file di output."""
-        return self.widgets['output_file'].text().strip()
+        return self._output_path
     
     def set_output_file_path(self, path):
         """Imposta il percorso del file di output."""
-        self.widgets['output_file'].setText(path)
+        self.output_file.setText(path)
     
     def get_password(self):
         """Ottiene la password."""
-        return self.widgets['password'].text()
+        return self.password.text()
     
     def clear_password(self):
         """Pulisce il campo password."""
-        self.widgets['password'].clear()
+        self.password.clear()
     
     def get_watermark_text(self):
         """Ottiene il testo della filigrana."""
-        return self.widgets['watermark'].text().strip()
+        return self._watermark_text
     
     def clear_watermark(self):
         """Pulisce il campo filigrana."""
-        self.widgets['watermark'].clear()
+        self.watermark.clear()
     
     def clear_all_fields(self):
         """Pulisce tutti i campi del form."""
-        self.widgets['input_file'].clear()
-        self.widgets['output_file'].clear()
-        self.widgets['password'].clear()
-        self.widgets['watermark'].clear()
+        # Segnali bloccati: i campi vengono svuotati senza notifiche intermedie
+        for field in (self.input_file, self.output_file, self.password, self.watermark):
+            with QSignalBlocker(field):
+                field.clear()
+        
+        # textChanged non è stato emesso: allinea i testi memorizzati
+        self._input_path = ''
+        self._output_path = ''
+        self._watermark_text = ''
     
     def show_status_message(self, message, timeout=0):
         """
@@ -354,52 +410,52 @@ class UIManager:
         Args:
             enabled (bool): True per abilitare, False per disabilitare
         """
-        button_names = [
-            'compress_btn', 'merge_btn', 'protect_btn',
-            'remove_protection_btn', 'watermark_btn', 'clear_btn'
-        ]
-        
-        for btn_name in button_names:
-            if btn_name in self.widgets:
-                self.widgets[btn_name].setEnabled(enabled)
+        for button in self._toggleable_buttons:
+            button.setEnabled(enabled)
     
     def update_translations(self):
         """Aggiorna tutti i testi dell'interfaccia con le nuove traduzioni."""
-        # Aggiorna il titolo della finestra
-        self.main_window.setWindowTitle(self._get_text('app_title'))
-        
-        # Aggiorna placeholder text
-        if 'input_file' in self.widgets:
-            self.widgets['input_file'].setPlaceholderText(self._get_text('input_file_placeholder'))
-        if 'output_file' in self.widgets:
-            self.widgets['output_file'].setPlaceholderText(self._get_text('output_directory_placeholder'))
-        if 'password' in self.widgets:
-            self.widgets['password'].setPlaceholderText(self._get_text('password_placeholder'))
-        if 'watermark' in self.widgets:
-            self.widgets['watermark'].setPlaceholderText(self._get_text('watermark_placeholder'))
-        
-        # Aggiorna testi dei bottoni della toolbar
-        button_text_map = {
-            'browse_btn': 'browse_btn',
-            'compress_btn': 'compress_btn',
-            'merge_btn': 'merge_btn',
-            'protect_btn': 'protect_btn',
-            'remove_protection_btn': 'remove_protection_btn',
-            'watermark_btn': 'watermark_btn',
-            'clear_btn': 'clear_btn'
-        }
-        
-        for widget_name, text_key in button_text_map.items():
-            if widget_name in self.widgets:
-                self.widgets[widget_name].setText(self._get_text(text_key))
-        
-        # Aggiorna status bar
-        self.show_status_message(self._get_text('ready'))
+        self._refresh_texts()
+        
+        # Il dialog informazioni verrà ricreato con la nuova lingua
+        if self._about_dialog is not None:
+            self._about_dialog.deleteLater()
+            self._about_dialog = None
+        
+        # Ridisegno sospeso finché tutti i testi non sono aggiornati
+        self.main_window.setUpdatesEnabled(False)
+        try:
+            # Aggiorna il titolo della finestra
+            self.main_window.setWindowTitle(self._get_text('app_title'))
+            
+            # Aggiorna placeholder text
+            if self.input_file is not None:
+                self.input_file.setPlaceholderText(self._get_text('input_file_placeholder'))
+            if self.output_file is not None:
+                self.output_file.setPlaceholderText(self._get_text('output_directory_placeholder'))
+            if self.password is not None:
+                self.password.setPlaceholderText(self._get_text('password_placeholder'))
+            if self.watermark is not None:
+                self.watermark.setPlaceholderText(self._get_text('watermark_placeholder'))
+            
+            # Aggiorna testi dei bottoni della toolbar
+            for name in _TOOLBAR_BUTTON_NAMES:
+                button = getattr(self, name)
+                if button is not None:
+                    button.setText(self._texts[name])
+            
+            # Aggiorna status bar
+            self.show_status_message(self._get_text('ready'))
+        finally:
+            self.main_window.setUpdatesEnabled(True)
     
     def show_about_dialog(self):
         """Mostra il dialog delle informazioni con tema applicato."""
-        dialog = AboutDialog(self.translations, self.theme_manager, self.main_window)
-        dialog.exec()
+        if self._about_dialog is None:
+            # Import ritardato: il dialog serve solo se viene aperto
+            from about_dialog import AboutDialog
+            self._about_dialog = AboutDialog(self.translations, self.main_window)
+        self._about_dialog.exec()
     
     def set_theme(self, theme_variant):
         """
@@ -417,36 +473,17 @@ class UIManager:
             return self.theme_manager.current_theme
         return ThemeVariant.LIGHT
     
+    def _refresh_texts(self):
+        """Ricalcola i testi dell'interfaccia per la lingua corrente."""
+        if self.translations:
+            get = self.translations.get
+            self._texts = {key: get(key) for key in _FALLBACK_TEXTS}
+        else:
+            self._texts = _FALLBACK_TEXTS
+    
     def _get_text(self, key):
         """Helper per ottenere testo tradotto."""
-        if self.translations:
-            return self.translations.get(key)
-        
-        # Testi di fallback in inglese
-        fallback_texts = {
-            'app_title': 'PDF Tools',
-            'file_selection': 'File Selection',
-            'options': 'Options',
-            'input_file': 'Input File:',
-            'output_file': 'Output File:',
-            'output_directory': 'Output Directory:',
-            'password': 'Password:',
-            'watermark': 'Watermark:',
-            'input_file_placeholder': 'Select a PDF file...',
-            'output_file_placeholder': 'Output filename...',
-            'output_directory_placeholder': 'Files will be automatically saved in output directory...',
-            'password_placeholder': 'Enter password...',
-            'watermark_placeholder': 'Enter watermark text...',
-            'browse_btn': 'Browse',
-            'compress_btn': 'Compress',
-            'merge_btn': 'Merge',
-            'protect_btn': 'Protect',
-            'remove_protection_btn': 'Remove Password',
-            'watermark_btn': 'Add Watermark',
-            'clear_btn': 'Clear Fields',
-            'ready': 'Ready...',
-            'about_title': 'About',
-            'close': 'Close'
-        }
-        
-        return fallback_texts.get(key, key)
\ No newline at end of file
+        text = self._texts.get(key)
+        if text is None:
+            text = self.translations.get(key) if self.translations else key
+        return text